@@ -7,6 +7,7 @@ memory-efficient by using __slots__ and direct attribute access.
 
 from __future__ import annotations
 
+from operator import attrgetter
 from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 if TYPE_CHECKING:
@@ -287,7 +288,7 @@ class PluginContext(Generic[ConfigT]):
                         ConversionOption(target_type=target_type, version=rule.version)
                     )
         for targets in conversions.values():
-            targets.sort(key=lambda opt: (opt.target_type, opt.version))
+            targets.sort(key=attrgetter("target_type", "version"))
         return conversions
 
     def get_rules_for_source(self, source_type: str) -> list[Rule]:
@@ -327,5 +328,5 @@ class PluginContext(Generic[ConfigT]):
             for r in self.rules
             if source_type in r.get_source_types() and target_type in r.get_target_types()
         ]
-        matching.sort(key=lambda r: r.version)
+        matching.sort(key=attrgetter("version"))
         return matching
@@ -29,32 +29,29 @@ class RuleFilter(BaseModel):
     @model_validator(mode="after")
     def _validate_structure(self) -> RuleFilter:
         """Ensure the filter is either a leaf or a composition."""
-        is_leaf = (
-            self.field is not None
-            or self.op is not None
-            or self.values is not None
-            or self.prefixes is not None
-        )
-        has_children = bool(self.any_of) or bool(self.all_of)
+        field, op, values, prefixes = self.field, self.op, self.values, self.prefixes
+        any_of, all_of = self.any_of, self.all_of
+        is_leaf = field is not None or op is not None or values is not None or prefixes is not None
+        has_children = bool(any_of) or bool(all_of)
 
         if is_leaf and has_children:
             raise ValueError("RuleFilter cannot mix field/op/values with any_of/all_of")
         if not is_leaf and not has_children:
             raise ValueError("RuleFilter requires field/op/values or any_of/all_of")
-        if self.any_of and self.all_of:
+        if any_of and all_of:
             raise ValueError("RuleFilter cannot set both any_of and all_of")
 
         if is_leaf:
-            if not self.field:
+            if not field:
                 raise ValueError("RuleFilter.field is required for leaf filters")
-            if self.op is None:
+            if op is None:
                 raise ValueError("RuleFilter.op is required for leaf filters")
-            if not (self.values or self.prefixes):
+            if not (values or prefixes):
                 raise ValueError("RuleFilter.values must contain at least one value")
-            if self.op == "geq" and len(self.values or []) != 1:
+            if op == "geq" and len(values or ()) != 1:
                 raise ValueError("RuleFilter.geq expects exactly one comparison value")
-            if self.op in {"startswith", "not_startswith"}:
-                prefix_values = self.prefixes if self.prefixes else self.values
+            if op in {"startswith", "not_startswith"}:
+                prefix_values = prefixes or values
                 if not prefix_values:
                     raise ValueError(
                         "RuleFilter.prefixes must provide at least one entry for prefix operations"
@@ -71,6 +68,19 @@ class RuleFilter(BaseModel):
 
         return _evaluate_rule_filter(component, rule_filter=self)
 
+    def compile(self) -> Callable[[Any], bool]:
+        """Return a predicate equivalent to :meth:`matches` for the current fields.
+
+        The predicate is not stored on the filter; callers evaluating many
+        components, such as the rule executor, build it once and reuse it.
+        One-off checks should call :meth:`matches`, which skips the build.
+        Composite children are tried cheapest first, so attributes may be
+        read in a different order than :meth:`matches` reads them.
+        """
+        from .utils import _compile_rule_filter
+
+        return _compile_rule_filter(self)
+
     def normalized_prefixes(self) -> list[str]:
         """Return the cached prefix values ready for prefix comparisons."""
         if self._normalized_prefixes is None:
@@ -112,12 +122,16 @@ class Rule:
     target_type: str | list[str]
     version: int
     field_map: dict[str, str | list[str]] = field(default_factory=dict)
-    getters: dict[str, RuleGetter | str] = field(default_factory=dict)
+    getters: dict[str, RuleGetter] = field(default_factory=dict)
     defaults: dict[str, Any] = field(default_factory=dict)
     filter: RuleFilter | None = field(default=None)
     system: Literal["source", "target"] = "source"
     name: str | None = None
     depends_on: list[str] | None = None
+    _source_types: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _target_types: tuple[str, ...] = field(init=False, repr=False, compare=False)
+    _hash: int = field(init=False, repr=False, compare=False)
+    _direct_fields: tuple[tuple[str, str], ...] = field(init=False, repr=False, compare=False)
 
     def __str__(self) -> str:
         """Represent string."""
@@ -135,19 +149,45 @@ class Rule:
             if isinstance(source_fields, list) and target_field not in self.getters:
                 msg = f"Multi-field mapping for '{target_field}' requires a getter function"
                 raise ValueError(msg)
+        for target_field, getter_func in self.getters.items():
+            if not callable(getter_func):
+                raise TypeError(f"Getter for '{target_field}' is not callable: {getter_func!r}")
         if self.filter is not None and not isinstance(self.filter, RuleFilter):
             raise TypeError(f"Rule.filter must be a RuleFilter, not {type(self.filter).__name__}")
 
-    def __hash__(self) -> int:
-        """Hash based on rule's unique identifier."""
+        # Rules are frozen, so the normalized types can be built once.
+        object.__setattr__(
+            self,
+            "_source_types",
+            tuple(self.source_type) if isinstance(self.source_type, list) else (self.source_type,),
+        )
+        object.__setattr__(
+            self,
+            "_target_types",
+            tuple(self.target_type) if isinstance(self.target_type, list) else (self.target_type,),
+        )
         source_key = tuple(self.source_type) if isinstance(self.source_type, list) else self.source_type
         target_key = tuple(self.target_type) if isinstance(self.target_type, list) else self.target_type
-        return hash((source_key, target_key, self.version))
+        object.__setattr__(self, "_hash", hash((source_key, target_key, self.version)))
+        # Single-attribute mappings, iterated per converted component; multi-field ones go through getters.
+        object.__setattr__(
+            self,
+            "_direct_fields",
+            tuple(
+                (target, source) for target, source in self.field_map.items() if not isinstance(source, list)
+            ),
+        )
+
+    def __hash__(self) -> int:
+        """Hash based on rule's unique identifier."""
+        return self._hash
 
     def __eq__(self, other: object) -> bool:
         """Equality based on rule's unique identifier."""
         if not isinstance(other, Rule):
             return NotImplemented
+        if self._hash != other._hash:
+            return False
         return (
             self.source_type == other.source_type
             and self.target_type == other.target_type
@@ -164,11 +204,11 @@ class Rule:
 
     def get_source_types(self) -> list[str]:
         """Return source types as list."""
-        return self.source_type if isinstance(self.source_type, list) else [self.source_type]
+        return list(self._source_types)
 
     def get_target_types(self) -> list[str]:
         """Return target types as list."""
-        return self.target_type if isinstance(self.target_type, list) else [self.target_type]
+        return list(self._target_types)
 
     @classmethod
     def from_records(cls, records: list[dict[str, Any]]) -> list[Rule]:
@@ -17,7 +17,6 @@ from .time_series import transfer_time_series_metadata
 from .utils import (
     _build_target_fields,
     _create_target_component,
-    _evaluate_rule_filter,
     _iter_system_components,
     _resolve_component_type,
     _sort_rules_by_dependencies,
@@ -45,7 +44,7 @@ def apply_rules_to_context(context: PluginContext) -> TranslationResult:
     if not context.rules:
         raise ValueError(f"{type(context).__name__} has no rules. Use context.list_rules().")
 
-    sorted_rules = _sort_rules_by_dependencies(context.list_rules()).unwrap_or_raise(exc_type=ValueError)
+    sorted_rules = _sort_rules_by_dependencies(context.rules).unwrap_or_raise(exc_type=ValueError)
 
     rule_results: list[RuleResult] = []
     total_converted = 0
@@ -115,13 +114,17 @@ def apply_single_rule(rule: Rule, *, context: PluginContext) -> Result[RuleAppli
 
     """
     converted = 0
-    should_regenerate_uuid = len(rule.get_target_types()) > 1
+    target_types = rule.get_target_types()
+    should_regenerate_uuid = len(target_types) > 1
 
     read_system = context.target_system if rule.system == "target" else context.source_system
     if read_system is None:
         return Err(ValueError(f"System '{rule.system}' is not set in context"))
     assert read_system is not None  # Type guard for type checker
 
+    # Build the filter predicate once per application so it reflects the filter's current fields.
+    filter_func: Callable[[Any], bool] | None = rule.filter.compile() if rule.filter is not None else None
+
     for source_type in rule.get_source_types():
         # Resolve source class, converting TypeError to ValueError
         source_class_result = _resolve_component_type(source_type, context=context).map_err(
@@ -131,17 +134,12 @@ def apply_single_rule(rule: Rule, *, context: PluginContext) -> Result[RuleAppli
         # Skip this source type if resolution failed, but return errors from conversions
         if source_class_result.is_err():
             logger.error("Source type resolution error: {}", source_class_result.err())
-            # Return the error properly typed
-            return source_class_result.map(lambda _: RuleApplicationStats(converted=0, skipped=0))
+            # An Err carries no value, so it can be returned as-is under the stats type
+            return cast(Result[RuleApplicationStats, ValueError], source_class_result)
 
         # Extract resolved source class (safe because is_ok() check passed)
         source_class = cast(type[Component], source_class_result.ok())
 
-        filter_func: Callable[[Any], bool] | None = None
-        if rule.filter is not None:
-            rule_filter = rule.filter
-            filter_func = lambda comp: _evaluate_rule_filter(comp, rule_filter=rule_filter)  # noqa: E731, B023
-
         found_component = False
 
         for src_component in _iter_system_components(
@@ -150,7 +148,7 @@ def apply_single_rule(rule: Rule, *, context: PluginContext) -> Result[RuleAppli
             filter_func=filter_func,
         ):
             found_component = True
-            for target_type in rule.get_target_types():
+            for target_type in target_types:
                 # Chain conversions: convert then attach using and_then
                 conversion_result = _convert_component(
                     rule, src_component, target_type, context, should_regenerate_uuid
@@ -158,7 +156,7 @@ def apply_single_rule(rule: Rule, *, context: PluginContext) -> Result[RuleAppli
 
                 # Return early on conversion failure
                 if conversion_result.is_err():
-                    return conversion_result.map(lambda _: RuleApplicationStats(converted=0, skipped=0))
+                    return cast(Result[RuleApplicationStats, ValueError], conversion_result)
 
                 converted += 1
 
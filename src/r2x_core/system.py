@@ -269,7 +269,7 @@ class System(InfrasysSystem):
                 system = super().from_json(source, upgrade_handler=upgrade_handler, **kwargs)
             case bytes():
                 logger.debug("Deserializing system from bytes.")
-                json_data = orjson.loads(source.decode("utf-8"))
+                json_data = orjson.loads(source)
                 ts_info = json_data.get("time_series")
                 if not ts_info:
                     msg = "Data is missing time series information. Check source."
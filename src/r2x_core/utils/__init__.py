@@ -4,6 +4,7 @@ from ._component import components_to_records, export_components_to_csv
 from ._rules import (
     _as_attr_source,
     _build_target_fields,
+    _compile_rule_filter,
     _create_target_component,
     _evaluate_rule_filter,
     _make_attr_getter,
@@ -33,6 +34,7 @@ __all__ = [
     "UpgradeType",
     "_as_attr_source",
     "_build_target_fields",
+    "_compile_rule_filter",
     "_create_target_component",
     "_evaluate_rule_filter",
     "_iter_system_components",
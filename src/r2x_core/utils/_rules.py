@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import importlib
-from collections.abc import Mapping
+from collections import deque
+from collections.abc import Callable, Mapping, Sequence
+from operator import attrgetter
 from types import SimpleNamespace
 from typing import TYPE_CHECKING, Any
 
@@ -11,13 +13,14 @@ from loguru import logger
 from rust_ok import Err, Ok, Result
 
 from ..plugin_context import PluginContext
-from ..rules import RuleGetter
+from ..rules import Rule, RuleFilter, RuleGetter
 
 if TYPE_CHECKING:
-    from ..rules import Rule, RuleFilter, RuleLike
+    from ..rules import RuleLike
 
 
-_COMPONENT_TYPE_CACHE: dict[str, type] = {}
+# Keyed by (config.models, type_name) so contexts searching different modules never share entries.
+_COMPONENT_TYPE_CACHE: dict[tuple[tuple[str, ...], str], type] = {}
 
 
 def _resolve_component_type(type_name: str, *, context: PluginContext) -> Result[type, TypeError]:
@@ -40,20 +43,25 @@ def _resolve_component_type(type_name: str, *, context: PluginContext) -> Result
 
     Notes
     -----
-    Uses a module-level cache dict to optimize repeated type lookups.
+    Uses a module-level cache dict to optimize repeated type lookups. Entries
+    are keyed by the searched modules as well as the type name, so a context
+    configured with different ``config.models`` resolves independently.
     Modules to search are configured via config.models.
     """
-    if type_name in _COMPONENT_TYPE_CACHE:
-        return Ok(_COMPONENT_TYPE_CACHE[type_name])
+    models = tuple(context.config.models)
+    cache_key = (models, type_name)
+    cached = _COMPONENT_TYPE_CACHE.get(cache_key)
+    if cached is not None:
+        return Ok(cached)
 
-    modules_to_search: list[str] = list(context.config.models)
+    modules_to_search: list[str] = list(models)
 
     for module_name in modules_to_search:
         try:
             module = importlib.import_module(module_name)
             if hasattr(module, type_name):
                 component_type = getattr(module, type_name)
-                _COMPONENT_TYPE_CACHE[type_name] = component_type
+                _COMPONENT_TYPE_CACHE[cache_key] = component_type
                 return Ok(component_type)
         except ImportError:
             continue
@@ -68,17 +76,20 @@ def _create_target_component(target_class: type, *, kwargs: dict[str, Any]) -> A
 
 
 def _make_attr_getter(chain: list[str]) -> RuleGetter:
-    """Create a getter that safely walks nested attributes and returns a Result."""
+    """Create a getter that safely walks nested attributes and returns a Result.
+
+    The dotted path is resolved by ``operator.attrgetter``; a missing or ``None``
+    link anywhere in the chain yields ``Ok(None)``.
+    """
+    read_path = attrgetter(".".join(chain))
 
     def _getter(src: Any, *, context: PluginContext) -> Result[Any, ValueError]:
         """Extract attributes."""
         _ = context
-        val = src
-        for attr in chain:
-            val = getattr(val, attr, None)
-            if val is None:
-                break
-        return Ok(val)
+        try:
+            return Ok(read_path(src))
+        except AttributeError:
+            return Ok(None)
 
     return _getter
 
@@ -115,15 +126,11 @@ def build_component_kwargs(
         Active context passed to getters.
     """
     source_obj = _as_attr_source(source_component)
-    field_map = getattr(rule, "field_map", {})
     getters = getattr(rule, "getters", {})
     defaults = getattr(rule, "defaults", {})
     kwargs: dict[str, Any] = {}
 
-    for target_field, source_field in field_map.items():
-        if isinstance(source_field, list):
-            # Multi-field mappings must be handled by a getter; skip direct assignment.
-            continue
+    for target_field, source_field in _direct_field_items(rule):
         value = getattr(source_obj, source_field, None)
         if value is None and target_field in defaults:
             value = defaults[target_field]
@@ -136,11 +143,14 @@ def build_component_kwargs(
 
         kwargs[target_field] = value
 
+    if not isinstance(rule, Rule):
+        # Rule checks its getters at construction; other rule-like objects are checked here.
+        for target_field, getter_func in getters.items():
+            if not callable(getter_func):
+                return Err(ValueError(f"Getter for '{target_field}' is not callable: {getter_func}"))
+
     for target_field, getter_func in getters.items():
-        if callable(getter_func):
-            result = getter_func(source_obj, context=context)
-        else:
-            return Err(ValueError(f"Getter for '{target_field}' is not callable: {getter_func}"))
+        result = getter_func(source_obj, context=context)
 
         match result:
             case Ok(value):
@@ -155,6 +165,18 @@ def build_component_kwargs(
     return Ok(kwargs)
 
 
+def _direct_field_items(rule: RuleLike) -> tuple[tuple[str, str], ...]:
+    """Return the single-attribute ``field_map`` entries of a rule.
+
+    Multi-field mappings are left to getters. ``Rule`` precomputes this tuple at
+    construction; other rule-like objects are scanned on each call.
+    """
+    if isinstance(rule, Rule):
+        return rule._direct_fields
+    field_map = getattr(rule, "field_map", {})
+    return tuple((target, source) for target, source in field_map.items() if not isinstance(source, list))
+
+
 def _evaluate_rule_filter(component: Any, *, rule_filter: RuleFilter) -> bool:
     """Return True if the component satisfies the rule filter."""
     if rule_filter.any_of is not None:
@@ -199,13 +221,235 @@ def _evaluate_rule_filter(component: Any, *, rule_filter: RuleFilter) -> bool:
     return False
 
 
-def _sort_rules_by_dependencies(rules: list[Rule]) -> Result[list[Rule], ValueError]:
+def _compile_rule_filter(rule_filter: RuleFilter) -> Callable[[Any], bool]:
+    """Build a predicate equivalent to evaluating ``rule_filter`` against a component.
+
+    The filter tree is walked once here: op dispatch and value normalization
+    happen at build time, so the returned closure only reads the component
+    attribute and compares it.
+
+    Raises
+    ------
+    ValueError
+        If a leaf filter is missing its field, op or values.
+    """
+    match rule_filter:
+        case RuleFilter(any_of=list() as children):
+            any_children = _compile_children(children)
+            return lambda component: any(predicate(component) for predicate in any_children)
+        case RuleFilter(all_of=list() as children):
+            all_children = _compile_children(children)
+            return lambda component: all(predicate(component) for predicate in all_children)
+        case RuleFilter(field=str() as field, op=str() as op, values=list()):
+            return _compile_leaf(rule_filter, field=field, op=op)
+        case _:
+            raise ValueError("RuleFilter must have field, op, and values for leaf filters")
+
+
+def _compile_leaf(rule_filter: RuleFilter, *, field: str, op: str) -> Callable[[Any], bool]:
+    """Build the predicate for a single field comparison.
+
+    Case-sensitive filters get closures without the casefold step, so the
+    flag is resolved here instead of on every component.
+    """
+    read_field = _field_reader(field)
+    casefold = rule_filter.casefold
+    include_missing = rule_filter.on_missing == "include"
+    # Normalized from the current fields each time a predicate is built, never stored on the filter.
+    values = _normalize_filter_values(rule_filter)
+
+    if op == "eq":
+        # Single-value equality is the common filter shape; compare inline instead of via a matcher.
+        expected = values[0]
+
+        def _equals(component: Any) -> bool:
+            try:
+                attr = read_field(component)
+            except AttributeError:
+                return include_missing
+            if attr is None:
+                return include_missing
+            if isinstance(attr, str):
+                # str() first: a (str, Enum) member casefolds as "fuel.gas", not its value.
+                attr = str(attr).casefold()
+            return bool(attr == expected)
+
+        def _equals_exact(component: Any) -> bool:
+            try:
+                attr = read_field(component)
+            except AttributeError:
+                return include_missing
+            if attr is None:
+                return include_missing
+            return bool(attr == expected)
+
+        return _equals if casefold else _equals_exact
+
+    compare = _LEAF_MATCHERS.get(op, _match_nothing)(values)
+
+    def _predicate(component: Any) -> bool:
+        try:
+            attr = read_field(component)
+        except AttributeError:
+            return include_missing
+        if attr is None:
+            return include_missing
+        return compare(str(attr).casefold() if isinstance(attr, str) else attr)
+
+    def _predicate_exact(component: Any) -> bool:
+        try:
+            attr = read_field(component)
+        except AttributeError:
+            return include_missing
+        if attr is None:
+            return include_missing
+        return compare(attr)
+
+    return _predicate if casefold else _predicate_exact
+
+
+def _field_reader(field: str) -> Callable[[Any], Any]:
+    """Return a reader with ``getattr`` semantics for a filter field.
+
+    ``attrgetter`` splits dotted names into a nested path, so a dotted field
+    is read as one literal attribute name instead, as ``getattr`` would.
+    """
+    if "." in field:
+        return lambda component: getattr(component, field)
+    return attrgetter(field)
+
+
+def _normalize_filter_values(rule_filter: RuleFilter) -> tuple[Any, ...]:
+    """Return the filter values, casefolded when ``casefold`` is set."""
+    if not rule_filter.casefold:
+        return tuple(rule_filter.values or ())
+    return tuple(str(val).casefold() if isinstance(val, str) else val for val in rule_filter.values or ())
+
+
+def _compile_children(children: list[RuleFilter]) -> tuple[Callable[[Any], bool], ...]:
+    """Compile composite children, cheapest comparisons first.
+
+    Trying hash and equality checks before string scans and nested subtrees
+    lets the composite short-circuit on the cheap ones. This changes the
+    evaluation order from the declared one, so attribute reads (including
+    properties and any exceptions they raise) can happen in a different
+    order than :meth:`RuleFilter.matches` would use. The sort is stable, so
+    children of equal cost keep their declared order.
+    """
+    ordered = sorted(children, key=_filter_cost)
+    return tuple(_compile_rule_filter(child) for child in ordered)
+
+
+# Relative evaluation cost per leaf op; composites sort after every leaf.
+_OP_COST: dict[str, int] = {
+    "eq": 0,
+    "neq": 0,
+    "in": 0,
+    "not_in": 0,
+    "geq": 1,
+    "startswith": 2,
+    "not_startswith": 2,
+    "endswith": 2,
+}
+_COMPOSITE_COST = 3
+
+
+def _filter_cost(rule_filter: RuleFilter) -> int:
+    """Return the static cost estimate used to order composite children."""
+    if rule_filter.op is None:
+        return _COMPOSITE_COST
+    return _OP_COST.get(rule_filter.op, _COMPOSITE_COST)
+
+
+def _match_neq(values: tuple[Any, ...]) -> Callable[[Any], bool]:
+    """Match candidates different from the single filter value."""
+    unexpected = values[0]
+    return lambda candidate: bool(candidate != unexpected)
+
+
+def _match_in(values: tuple[Any, ...]) -> Callable[[Any], bool]:
+    """Match candidates contained in the filter values."""
+    return _membership(values)
+
+
+def _match_not_in(values: tuple[Any, ...]) -> Callable[[Any], bool]:
+    """Match candidates absent from the filter values."""
+    contains = _membership(values)
+    return lambda candidate: not contains(candidate)
+
+
+def _membership(values: tuple[Any, ...]) -> Callable[[Any], bool]:
+    """Return a membership test, hashing the values when they allow it."""
+    try:
+        lookup = frozenset(values)
+    except TypeError:
+        return lambda candidate: candidate in values
+
+    def _contains(candidate: Any) -> bool:
+        try:
+            return candidate in lookup
+        except TypeError:
+            # Unhashable candidates (e.g. list attributes) fall back to the scan.
+            return candidate in values
+
+    return _contains
+
+
+def _match_geq(values: tuple[Any, ...]) -> Callable[[Any], bool]:
+    """Match candidates numerically greater than or equal to the threshold."""
+    threshold = values[0]
+
+    def _geq(candidate: Any) -> bool:
+        try:
+            return float(candidate) >= float(threshold)
+        except (TypeError, ValueError):
+            return False
+
+    return _geq
+
+
+def _match_startswith(values: tuple[Any, ...]) -> Callable[[Any], bool]:
+    """Match candidates starting with any filter value."""
+    return lambda candidate: str(candidate).startswith(values)
+
+
+def _match_not_startswith(values: tuple[Any, ...]) -> Callable[[Any], bool]:
+    """Match candidates starting with none of the filter values."""
+    return lambda candidate: not str(candidate).startswith(values)
+
+
+def _match_endswith(values: tuple[Any, ...]) -> Callable[[Any], bool]:
+    """Match candidates ending with any filter value."""
+    return lambda candidate: str(candidate).endswith(values)
+
+
+def _match_nothing(values: tuple[Any, ...]) -> Callable[[Any], bool]:
+    """Reject every candidate; used for unknown ops."""
+    _ = values
+    return lambda candidate: False
+
+
+# Leaf op -> builder of the comparison against already-normalized filter values.
+# ``eq`` is compiled inline by _compile_leaf.
+_LEAF_MATCHERS: dict[str, Callable[[tuple[Any, ...]], Callable[[Any], bool]]] = {
+    "neq": _match_neq,
+    "in": _match_in,
+    "not_in": _match_not_in,
+    "geq": _match_geq,
+    "startswith": _match_startswith,
+    "not_startswith": _match_not_startswith,
+    "endswith": _match_endswith,
+}
+
+
+def _sort_rules_by_dependencies(rules: Sequence[Rule]) -> Result[list[Rule], ValueError]:
     """Sort rules by dependencies using topological sort.
 
     Parameters
     ----------
-    rules : list[Rule]
-        Rules to sort
+    rules : Sequence[Rule]
+        Rules to sort. The input is only read, so a context's rule tuple can be
+        passed without copying it first.
 
     Returns
     -------
@@ -228,39 +472,43 @@ def _sort_rules_by_dependencies(rules: list[Rule]) -> Result[list[Rule], ValueEr
         else:
             unnamed_rules.append(rule)
 
-    # Dependency graph
-    in_degree: dict[str, int] = dict.fromkeys(named_rules, 0)
-    adjacency: dict[str, list[str]] = {name: [] for name in named_rules}
+    # Dependency graph over integer positions; names are only hashed while building it.
+    names = list(named_rules)
+    ordered_rules = list(named_rules.values())
+    position = {name: index for index, name in enumerate(names)}
+    in_degree = [0] * len(names)
+    adjacency: list[list[int]] = [[] for _ in names]
 
-    for name, rule in named_rules.items():
+    for index, rule in enumerate(ordered_rules):
         if rule.depends_on:
             for dep in rule.depends_on:
-                if dep not in named_rules:
-                    return Err(ValueError(f"Rule '{name}' depends on unknown rule '{dep}'"))
-                adjacency[dep].append(name)
-                in_degree[name] += 1
+                dep_index = position.get(dep)
+                if dep_index is None:
+                    return Err(ValueError(f"Rule '{names[index]}' depends on unknown rule '{dep}'"))
+                adjacency[dep_index].append(index)
+                in_degree[index] += 1
 
     # Kahn's algorithm
-    queue = [name for name, degree in in_degree.items() if degree == 0]
-    sorted_names: list[str] = []
+    queue = deque(index for index, degree in enumerate(in_degree) if degree == 0)
+    sorted_indices: list[int] = []
 
     while queue:
-        current = queue.pop(0)
-        sorted_names.append(current)
+        current = queue.popleft()
+        sorted_indices.append(current)
 
         for neighbor in adjacency[current]:
             in_degree[neighbor] -= 1
             if in_degree[neighbor] == 0:
                 queue.append(neighbor)
 
-    if len(sorted_names) != len(named_rules):
-        unsorted = set(named_rules.keys()) - set(sorted_names)
+    if len(sorted_indices) != len(names):
+        unsorted = [names[index] for index, degree in enumerate(in_degree) if degree > 0]
         return Err(ValueError(f"Circular dependencies detected in rules: {', '.join(unsorted)}"))
 
     unnamed_no_deps = [rule for rule in unnamed_rules if not rule.depends_on]
     unnamed_with_deps = [rule for rule in unnamed_rules if rule.depends_on]
 
-    sorted_rules: list[Rule] = unnamed_no_deps + [named_rules[name] for name in sorted_names]
+    sorted_rules: list[Rule] = unnamed_no_deps + [ordered_rules[index] for index in sorted_indices]
 
     for rule in unnamed_with_deps:
         deps = rule.depends_on or []
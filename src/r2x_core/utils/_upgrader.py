@@ -12,9 +12,12 @@ The upgrade system uses a priority queue where lower numbers execute first.
 Version comparison is delegated to configurable VersionStrategy implementations.
 """
 
+import inspect
 from collections.abc import Callable
+from contextlib import suppress
 from enum import Enum
 from typing import Annotated, Any
+from weakref import WeakKeyDictionary
 
 from loguru import logger
 from pydantic import BaseModel
@@ -173,12 +176,7 @@ def run_upgrade_step(
     logger.debug("Applying upgrade step: {}", step.name)
     try:
         # Try to pass upgrader_context if the function accepts it
-        import inspect
-
-        sig = inspect.signature(step.func)
-        if "upgrader_context" in sig.parameters or any(
-            p.kind == inspect.Parameter.VAR_KEYWORD for p in sig.parameters.values()
-        ):
+        if _accepts_upgrader_context(step.func):
             data = step.func(data, upgrader_context=upgrader_context)
         else:
             data = step.func(data)
@@ -186,3 +184,30 @@ def run_upgrade_step(
         return Err(f"Failed {step.name}: {e}")
     logger.info("Successfully applied upgrade: {} -> {}", step.name, step.target_version)
     return Ok(data)
+
+
+# Signature inspection result per step function; entries go away with the function.
+_ACCEPTS_CONTEXT_CACHE: WeakKeyDictionary[Callable[..., Any], bool] = WeakKeyDictionary()
+
+
+def _accepts_upgrader_context(func: Callable[..., Any]) -> bool:
+    """Return True if ``func`` takes an ``upgrader_context`` keyword.
+
+    The answer is cached per function object. Callables that cannot be weakly
+    referenced are inspected on every call.
+
+    Raises
+    ------
+    ValueError
+        If the signature of ``func`` cannot be inspected.
+    """
+    with suppress(KeyError, TypeError):
+        return _ACCEPTS_CONTEXT_CACHE[func]
+
+    parameters = inspect.signature(func).parameters
+    accepts = "upgrader_context" in parameters or any(
+        p.kind == inspect.Parameter.VAR_KEYWORD for p in parameters.values()
+    )
+    with suppress(TypeError):
+        _ACCEPTS_CONTEXT_CACHE[func] = accepts
+    return accepts
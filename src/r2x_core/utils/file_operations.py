@@ -2,6 +2,7 @@
 
 import os
 import platform
+from fnmatch import fnmatch
 from pathlib import Path
 
 from loguru import logger
@@ -108,7 +109,7 @@ def resolve_glob_pattern(pattern: str, *, search_dir: Path) -> Result[Path, Valu
         msg = f"Pattern '{pattern}' does not contain glob wildcards (*, ?, [, ]). Use 'fpath' or 'relative_fpath' for exact filenames."
         return Err(ValueError(msg))
 
-    matches = [p for p in search_dir.glob(pattern) if p.is_file()]
+    matches = _glob_files(pattern, search_dir=search_dir)
 
     if not matches:
         msg = f"No files found matching pattern '{pattern}' in {search_dir}"
@@ -121,3 +122,26 @@ def resolve_glob_pattern(pattern: str, *, search_dir: Path) -> Result[Path, Valu
 
     logger.debug("Glob pattern {} resolved to: {}", pattern, matches[0])
     return Ok(matches[0])
+
+
+def _glob_files(pattern: str, *, search_dir: Path) -> list[Path]:
+    """Return the regular files in ``search_dir`` that match ``pattern``.
+
+    Flat patterns (no path separators or ``**``) are matched against a single
+    ``os.scandir`` pass, so the file check reuses the directory entry type
+    instead of issuing one ``stat`` per match. Nested or recursive patterns
+    fall back to :meth:`pathlib.Path.glob`.
+    """
+    if "**" in pattern or "/" in pattern or os.sep in pattern:
+        return [p for p in search_dir.glob(pattern) if p.is_file()]
+
+    try:
+        with os.scandir(search_dir) as entries:
+            return [
+                search_dir / entry.name
+                for entry in entries
+                if entry.is_file() and fnmatch(entry.name, pattern)
+            ]
+    except OSError:
+        # Missing or unreadable directories yield no matches, as Path.glob does.
+        return []
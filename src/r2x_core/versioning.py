@@ -18,6 +18,7 @@ See Also
 from __future__ import annotations
 
 from abc import abstractmethod
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Protocol, runtime_checkable
 
@@ -76,12 +77,14 @@ class SemanticVersioningStrategy(VersionStrategy):
         Splits versions into components and compares numerically.
         Handles different component lengths (1.0 vs 1.0.0).
         """
-        current_parts = [int(x) for x in current.split(".")]
-        target_parts = [int(x) for x in target.split(".")]
+        current_parts = _parse_semantic_version(current)
+        target_parts = _parse_semantic_version(target)
 
-        max_len = max(len(current_parts), len(target_parts))
-        current_parts.extend([0] * (max_len - len(current_parts)))
-        target_parts.extend([0] * (max_len - len(target_parts)))
+        width = len(current_parts) - len(target_parts)
+        if width > 0:
+            target_parts += (0,) * width
+        elif width < 0:
+            current_parts += (0,) * -width
 
         if current_parts < target_parts:
             return -1
@@ -90,6 +93,16 @@ class SemanticVersioningStrategy(VersionStrategy):
         return 0
 
 
+@lru_cache(maxsize=256)
+def _parse_semantic_version(version: str) -> tuple[int, ...]:
+    """Split a dotted version into integer components.
+
+    Cached because upgrade checks compare the same handful of step and data
+    versions repeatedly.
+    """
+    return tuple(int(part) for part in version.split("."))
+
+
 class GitVersioningStrategy(VersionStrategy):
     """Git-based versioning using commit history order.
 
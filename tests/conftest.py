@@ -5,6 +5,7 @@ import pytest
 from loguru import logger
 
 from r2x_core.logger import setup_logging
+from r2x_core.units import get_unit_system, set_unit_system
 
 DATA_FOLDER = "tests/data"
 REEDS_SCENARIO = "test_Pacific"
@@ -29,6 +30,14 @@ def pytest_configure(config: pytest.Config) -> None:
     )
 
 
+@pytest.fixture(autouse=True)
+def _restore_unit_system() -> Generator[None, None, None]:
+    """Restore the global unit system so a failing test cannot leak its display mode."""
+    previous = get_unit_system()
+    yield
+    set_unit_system(previous)
+
+
 @pytest.fixture(scope="function")
 def empty_file(tmp_path) -> Generator[Path, None, None]:
     empty_fpath = tmp_path / "test.csv"
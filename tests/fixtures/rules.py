@@ -3,9 +3,12 @@ import pytest
 from r2x_core import Rule
 
 
-@pytest.fixture
-def rules_simple() -> list[Rule]:
-    """Translation rules between source and target fixture components."""
+@pytest.fixture(scope="session")
+def rules_simple() -> tuple[Rule, ...]:
+    """Translation rules between source and target fixture components.
+
+    Rules are frozen, so one tuple is shared by every test in the session.
+    """
 
     rules = [
         {
@@ -48,4 +51,4 @@ def rules_simple() -> list[Rule]:
             "defaults": {"resource": "unknown"},
         },
     ]
-    return Rule.from_records(rules)
+    return tuple(Rule.from_records(rules))
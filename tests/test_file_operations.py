@@ -2,6 +2,8 @@ import os
 from pathlib import Path
 from unittest.mock import patch
 
+import pytest
+
 from r2x_core.utils.file_operations import backup_folder, get_r2x_cache_path, resolve_glob_pattern
 
 
@@ -122,3 +124,55 @@ def test_resolve_glob_pattern_rejects_non_pattern(tmp_path):
     result = resolve_glob_pattern("exact.csv", search_dir=tmp_path)
     assert result.is_err()
     assert "does not contain glob wildcards" in str(result.err())
+
+
+def test_resolve_glob_pattern_flat_pattern_skips_directories(tmp_path):
+    (tmp_path / "model.xml").mkdir()
+    (tmp_path / "model_1.xml").write_text("<root/>")
+    (tmp_path / "other.csv").write_text("a\n1\n")
+
+    result = resolve_glob_pattern("model*.xml", search_dir=tmp_path)
+    assert result.is_ok()
+    assert result.unwrap() == tmp_path / "model_1.xml"
+
+
+def test_resolve_glob_pattern_nested_pattern(tmp_path):
+    sub_dir = tmp_path / "sub"
+    sub_dir.mkdir()
+    (sub_dir / "nested.xml").write_text("<root/>")
+
+    result = resolve_glob_pattern("sub/*.xml", search_dir=tmp_path)
+    assert result.is_ok()
+    assert result.unwrap() == sub_dir / "nested.xml"
+
+
+def test_resolve_glob_pattern_missing_search_dir(tmp_path):
+    result = resolve_glob_pattern("*.xml", search_dir=tmp_path / "missing")
+    assert result.is_err()
+    assert isinstance(result.err(), FileNotFoundError)
+
+
+def test_resolve_glob_pattern_recursive_wildcard_matches_directories_only(tmp_path):
+    (tmp_path / "model.xml").write_text("<root/>")
+
+    result = resolve_glob_pattern("**", search_dir=tmp_path)
+    assert result.is_err()
+    assert isinstance(result.err(), FileNotFoundError)
+
+
+@pytest.mark.skipif(
+    not hasattr(os, "geteuid") or os.geteuid() == 0, reason="directory permissions are not enforced"
+)
+def test_resolve_glob_pattern_unreadable_search_dir(tmp_path):
+    search_dir = tmp_path / "locked"
+    search_dir.mkdir()
+    (search_dir / "model.xml").write_text("<root/>")
+    search_dir.chmod(0)
+    try:
+        result = resolve_glob_pattern("*.xml", search_dir=search_dir)
+    finally:
+        search_dir.chmod(0o755)
+
+    assert result.is_err()
+    assert isinstance(result.err(), FileNotFoundError)
+    assert "No files found" in str(result.err())
@@ -9,6 +9,20 @@ This module validates that the getter decorator works correctly with all usage p
 import pytest
 
 
+class _Child:
+    __slots__ = ("value",)
+
+    def __init__(self, value: int) -> None:
+        self.value = value
+
+
+class _Parent:
+    __slots__ = ("child",)
+
+    def __init__(self, child: _Child) -> None:
+        self.child = child
+
+
 def test_getter_without_parentheses_registers_function():
     """@getter without parentheses registers function with its name."""
     from r2x_core.getters import GETTER_REGISTRY, getter
@@ -249,16 +263,10 @@ def test_preprocess_rule_getters_builds_attr_getter():
     """String path not in registry becomes attribute getter."""
     from r2x_core.getters import _preprocess_rule_getters
 
-    class Child:
-        value = 123
-
-    class Parent:
-        child = Child()
-
     result = _preprocess_rule_getters({"field": "child.value"})
     assert result.is_ok()
     getter_fn = result.unwrap()["field"]
-    out = getter_fn(Parent(), context=None)
+    out = getter_fn(_Parent(_Child(123)), context=None)
     assert out.is_ok()
     assert out.unwrap() == 123
 
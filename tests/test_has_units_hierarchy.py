@@ -126,18 +126,6 @@ def test_has_units_no_system_base_attribute():
     assert not hasattr(sensor, "_system_base")
 
 
-def test_has_per_units_has_system_base_attribute():
-    """Test that HasPerUnit has _system_base attribute."""
-    gen = Generator(
-        name="Gen1",
-        base_power=100.0,
-        rated_voltage=13.8,
-        rating=0.8,
-        voltage=1.0,
-    )
-    assert hasattr(gen, "_system_base")
-
-
 def test_has_per_units_system_base_can_be_set():
     """Test that _system_base can be set on HasPerUnit."""
     gen = Generator(
@@ -147,6 +135,7 @@ def test_has_per_units_system_base_can_be_set():
         rating=0.8,
         voltage=1.0,
     )
+    assert gen._get_system_base() is None
     gen._system_base = 150.0
     assert gen._system_base == 150.0
 
@@ -5,6 +5,8 @@ import sys
 from datetime import datetime
 from unittest import mock
 
+import pytest
+
 from r2x_core.logger import (
     DEFAULT_LOG_LEVEL,
     DEFAULT_TIME_FORMAT,
@@ -23,6 +25,17 @@ from r2x_core.logger import (
     structured_sink,
 )
 
+LOGGER_METHODS = frozenset({"trace", "debug", "info", "warning", "error", "exception"})
+
+
+@pytest.fixture(scope="module")
+def raised_exc_info():
+    """Raise and catch one exception for the module; its exc_info is inert afterwards."""
+    try:
+        raise RuntimeError("Test error")
+    except RuntimeError:
+        return sys.exc_info()
+
 
 def test_format_timestamp_default_format():
     """Test timestamp formatting with default format."""
@@ -66,87 +79,75 @@ def test_render_exception_with_incomplete_exception():
     _render_exception(record, None)
 
 
-def test_render_exception_with_traceback_no_rich(capsys):
+def test_render_exception_with_traceback_no_rich(capsys, raised_exc_info):
     """Test _render_exception with traceback when Rich unavailable."""
-    try:
-        raise ValueError("Test error")
-    except ValueError:
-        exc_info = sys.exc_info()
-        record = {
-            "exception": mock.Mock(
-                type=exc_info[0],
-                value=exc_info[1],
-                traceback=exc_info[2],
-            )
-        }
-        _render_exception(record, None)
-
-        output = capsys.readouterr().err
-        assert "ValueError" in output or "Test error" in output
-
-
-def test_format_tty_basic(capsys):
-    """Test TTY formatting basic output."""
-    import r2x_core.logger as logger_module
-
-    logger_module._verbosity = 0
-
-    level_mock = mock.Mock()
-    level_mock.name = "INFO"
-
+    exc_type, exc_value, exc_traceback = raised_exc_info
     record = {
-        "level": level_mock,
-        "message": "test message",
-        "extra": {},
-        "exception": None,
+        "exception": mock.Mock(
+            type=exc_type,
+            value=exc_value,
+            traceback=exc_traceback,
+        )
     }
-    format_tty(record)
+    _render_exception(record, None)
+
     output = capsys.readouterr().err
-    assert "INFO" in output
-    assert "test message" in output
+    assert "RuntimeError" in output or "Test error" in output
+
 
+_RECORD_TIME = datetime(2026, 1, 18, 10, 30, 45, 123456)
 
-def test_format_tty_with_timestamp(capsys):
-    """Test TTY formatting with timestamp when verbosity >= 2."""
+
+@pytest.mark.parametrize("has_time", [False, True], ids=["no_time", "time"])
+@pytest.mark.parametrize(
+    "level,message,extra,expected_level",
+    [
+        ("INFO", "test message", {}, "INFO"),
+        ("WARNING", "warn message", {"user_id": 123, "action": "login", "name": "ignored"}, "WARN"),
+    ],
+    ids=["basic", "with_extras"],
+)
+def test_format_tty(monkeypatch, capsys, level, message, extra, expected_level, has_time):
+    """Test TTY formatting of level, message and extra fields, with or without a record time."""
     import r2x_core.logger as logger_module
 
-    logger_module._verbosity = VERBOSITY_TRACE
+    monkeypatch.setattr(logger_module, "_verbosity", 0)
 
     level_mock = mock.Mock()
-    level_mock.name = "DEBUG"
+    level_mock.name = level
 
-    record = {
-        "level": level_mock,
-        "message": "debug message",
-        "extra": {},
-        "time": datetime(2026, 1, 18, 10, 30, 45, 123456),
-        "exception": None,
-    }
+    record = {"level": level_mock, "message": message, "extra": extra, "exception": None}
+    if has_time:
+        record["time"] = _RECORD_TIME
     format_tty(record)
     output = capsys.readouterr().err
-    assert "DEBUG" in output
-    assert "debug message" in output
+    assert expected_level in output
+    assert message in output
+    assert "10:30:45" not in output
 
 
-def test_format_tty_with_extras(capsys):
-    """Test TTY formatting with extra fields."""
+def test_format_tty_with_timestamp(monkeypatch, capsys):
+    """Test TTY formatting prefixes the record time at TRACE verbosity."""
     import r2x_core.logger as logger_module
 
-    logger_module._verbosity = 0
+    monkeypatch.setattr(logger_module, "_verbosity", VERBOSITY_TRACE)
+    monkeypatch.delenv("LOG_TIME_FORMAT", raising=False)
 
     level_mock = mock.Mock()
-    level_mock.name = "WARNING"
+    level_mock.name = "DEBUG"
 
     record = {
         "level": level_mock,
-        "message": "warn message",
-        "extra": {"user_id": 123, "action": "login", "name": "ignored"},
+        "message": "debug message",
+        "extra": {},
+        "time": _RECORD_TIME,
         "exception": None,
     }
     format_tty(record)
     output = capsys.readouterr().err
-    assert "WARN" in output
-    assert "warn message" in output
+    assert "DEBUG" in output
+    assert "debug message" in output
+    assert "10:30:45" in output
 
 
 def test_format_json_basic():
@@ -213,35 +214,32 @@ def test_format_json_with_file_info():
     assert payload["line"] == 42
 
 
-def test_format_json_with_exception():
+def test_format_json_with_exception(raised_exc_info):
     """Test JSON formatting with exception."""
-    try:
-        raise RuntimeError("Test error")
-    except RuntimeError:
-        exc_info = sys.exc_info()
-
-        level_mock = mock.Mock()
-        level_mock.name = "ERROR"
-
-        record = {
-            "level": level_mock,
-            "time": datetime(2026, 1, 18, 10, 30, 45, 123456),
-            "message": "error occurred",
-            "extra": {},
-            "file": None,
-            "exception": mock.Mock(
-                type=exc_info[0],
-                value=exc_info[1],
-                traceback=exc_info[2],
-            ),
-        }
-        result = format_json(record)
-        payload = json.loads(result)
-
-        assert "error" in payload
-        assert payload["error"]["type"] == "RuntimeError"
-        assert payload["error"]["message"] == "Test error"
-        assert "traceback" in payload["error"]
+    exc_type, exc_value, exc_traceback = raised_exc_info
+
+    level_mock = mock.Mock()
+    level_mock.name = "ERROR"
+
+    record = {
+        "level": level_mock,
+        "time": datetime(2026, 1, 18, 10, 30, 45, 123456),
+        "message": "error occurred",
+        "extra": {},
+        "file": None,
+        "exception": mock.Mock(
+            type=exc_type,
+            value=exc_value,
+            traceback=exc_traceback,
+        ),
+    }
+    result = format_json(record)
+    payload = json.loads(result)
+
+    assert "error" in payload
+    assert payload["error"]["type"] == "RuntimeError"
+    assert payload["error"]["message"] == "Test error"
+    assert "traceback" in payload["error"]
 
 
 def test_format_json_with_extras():
@@ -294,8 +292,7 @@ def test_get_logger_returns_bound_logger():
     """Test that get_logger returns a bound logger."""
     custom_logger = get_logger("my.component")
     assert custom_logger is not None
-    assert hasattr(custom_logger, "info")
-    assert hasattr(custom_logger, "debug")
+    assert set(dir(custom_logger)) >= LOGGER_METHODS
 
 
 def test_get_logger_with_different_names():
@@ -303,24 +300,15 @@ def test_get_logger_with_different_names():
     logger1 = get_logger("component1")
     logger2 = get_logger("component2")
 
-    assert logger1 is not None
-    assert logger2 is not None
-
-
-def test_level_names_coverage():
-    """Test that LEVEL_NAMES contains expected levels."""
-    expected_levels = {"TRACE", "DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
-    assert set(LEVEL_NAMES.keys()) == expected_levels
-
-
-def test_level_colors_coverage():
-    """Test that LEVEL_COLORS contains expected levels."""
-    expected_levels = {"TRACE", "DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
-    assert set(LEVEL_COLORS.keys()) == expected_levels
+    assert set(dir(logger1)) >= LOGGER_METHODS
+    assert set(dir(logger2)) >= LOGGER_METHODS
 
 
 def test_default_constants():
-    """Test default constants are set correctly."""
+    """Test default constants and level tables are set correctly."""
+    expected_levels = {"TRACE", "DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
+    assert LEVEL_NAMES.keys() == expected_levels
+    assert LEVEL_COLORS.keys() == expected_levels
     assert DEFAULT_LOG_LEVEL == "WARNING"
     assert VERBOSITY_INFO == 0
     assert VERBOSITY_DEBUG == 1
@@ -344,11 +332,11 @@ def test_get_console_is_cached():
     assert first is second
 
 
-def test_format_tty_with_rich_text_output(capsys):
+def test_format_tty_with_rich_text_output(monkeypatch, capsys):
     """Test TTY formatting produces rich text output when Rich is available."""
     import r2x_core.logger as logger_module
 
-    logger_module._verbosity = 0
+    monkeypatch.setattr(logger_module, "_verbosity", 0)
     _get_console.cache_clear()
 
     level_mock = mock.Mock()
@@ -371,7 +359,7 @@ def test_format_tty_fallback_no_rich(monkeypatch, capsys):
     """Test TTY formatting fallback when Rich is not available."""
     import r2x_core.logger as logger_module
 
-    logger_module._verbosity = 0
+    monkeypatch.setattr(logger_module, "_verbosity", 0)
     _get_console.cache_clear()
     monkeypatch.setattr("r2x_core.logger._get_console", lambda: None)
 
@@ -391,23 +379,20 @@ def test_format_tty_fallback_no_rich(monkeypatch, capsys):
     assert "DEBUG" in output
 
 
-def test_render_exception_with_traceback_and_rich(capsys):
+def test_render_exception_with_traceback_and_rich(capsys, raised_exc_info):
     """Test exception rendering with Rich traceback."""
     _get_console.cache_clear()
     console = _get_console()
 
-    try:
-        raise ValueError("Test exception")
-    except ValueError:
-        exc_info = sys.exc_info()
-        record = {
-            "exception": mock.Mock(
-                type=exc_info[0],
-                value=exc_info[1],
-                traceback=exc_info[2],
-            ),
-        }
-        _render_exception(record, console)
+    exc_type, exc_value, exc_traceback = raised_exc_info
+    record = {
+        "exception": mock.Mock(
+            type=exc_type,
+            value=exc_value,
+            traceback=exc_traceback,
+        ),
+    }
+    _render_exception(record, console)
 
 
 def test_structured_sink_tty_mode(monkeypatch, capsys):
@@ -415,7 +400,7 @@ def test_structured_sink_tty_mode(monkeypatch, capsys):
     import r2x_core.logger as logger_module
 
     monkeypatch.setattr(sys.stderr, "isatty", lambda: True)
-    logger_module._verbosity = 0
+    monkeypatch.setattr(logger_module, "_verbosity", 0)
     _get_console.cache_clear()
     monkeypatch.setattr("r2x_core.logger._get_console", lambda: None)
 
@@ -467,7 +452,7 @@ def test_format_tty_fallback_with_timestamp_and_extras(monkeypatch, capsys):
     """Test fallback TTY formatting with both timestamp and extras."""
     import r2x_core.logger as logger_module
 
-    logger_module._verbosity = VERBOSITY_TRACE
+    monkeypatch.setattr(logger_module, "_verbosity", VERBOSITY_TRACE)
     _get_console.cache_clear()
     monkeypatch.setattr("r2x_core.logger._get_console", lambda: None)
 
@@ -494,7 +479,7 @@ def test_format_tty_fallback_only_extras(monkeypatch, capsys):
     """Test fallback TTY formatting with extras but no timestamp."""
     import r2x_core.logger as logger_module
 
-    logger_module._verbosity = 0
+    monkeypatch.setattr(logger_module, "_verbosity", 0)
     _get_console.cache_clear()
     monkeypatch.setattr("r2x_core.logger._get_console", lambda: None)
 
@@ -147,7 +147,7 @@ def test_read_data_file_with_processing_error(reader_example, sample_csv, tmp_pa
         proc_spec=TabularProcessing(column_schema={"a": "invalid_type_name"}),
     )
 
-    with pytest.raises(ValueError):
+    with pytest.raises(ValueError, match="Unsupported data type"):
         reader_example.read_data_file(data_file, folder_path=tmp_path)
 
 
@@ -148,24 +148,16 @@ def test_glob_character_wildcard(data_reader, tmp_path):
 def test_glob_error_message_includes_suggestions(data_reader, empty_dir):
     data_file = DataFile(name="test_xml", glob="*.xml")
 
-    with pytest.raises(FileNotFoundError) as exc_info:
+    with pytest.raises(FileNotFoundError, match="No files found"):
         data_reader.read_data_file(data_file, folder_path=empty_dir)
 
-    error_msg = str(exc_info.value)
-    assert "No files found" in error_msg
-
 
 def test_glob_multiple_matches_lists_files(data_reader, multi_xml_dir):
     data_file = DataFile(name="test_xml", glob="*.xml")
 
-    with pytest.raises(ValueError) as exc_info:
+    with pytest.raises(ValueError, match=r"(?s)model_0\.xml.*model_1\.xml.*model_2\.xml"):
         data_reader.read_data_file(data_file, folder_path=multi_xml_dir)
 
-    error_msg = str(exc_info.value)
-    assert "model_0.xml" in error_msg
-    assert "model_1.xml" in error_msg
-    assert "model_2.xml" in error_msg
-
 
 def test_glob_with_reader_function(data_reader, single_xml_dir):
     from r2x_core.datafile import ReaderConfig
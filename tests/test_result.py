@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from collections.abc import Callable
+from dataclasses import FrozenInstanceError
 
 import pytest
 
@@ -10,9 +11,9 @@ from r2x_core.result import RuleResult, TranslationResult
 from r2x_core.rules import Rule
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_rule() -> Rule:
-    """Return a simple rule instance for the tests."""
+    """Return a simple rule instance shared across the tests (rules are frozen)."""
     return Rule(source_type="RuleA", target_type="RuleB", version=1)
 
 
@@ -69,71 +70,70 @@ def translation_result_factory(
     return factory
 
 
-def test_rule_result_creation(rule_result_factory: Callable[..., RuleResult], sample_rule: Rule) -> None:
+@pytest.mark.parametrize(
+    "converted,skipped,success,error",
+    [(5, 2, True, None), (0, 0, False, "Rule execution failed")],
+    ids=["success", "with_error"],
+)
+def test_rule_result_creation(
+    rule_result_factory: Callable[..., RuleResult],
+    sample_rule: Rule,
+    converted: int,
+    skipped: int,
+    success: bool,
+    error: str | None,
+) -> None:
     """RuleResult should store the provided values and rule reference."""
-    result = rule_result_factory(converted=5, skipped=2, success=True)
+    result = rule_result_factory(converted=converted, skipped=skipped, success=success, error=error)
 
     assert result.rule is sample_rule
-    assert result.converted == 5
-    assert result.skipped == 2
-    assert result.success is True
-    assert result.error is None
-
-
-def test_rule_result_with_error(rule_result_factory: Callable[..., RuleResult]) -> None:
-    """Errors provided to RuleResult should be preserved."""
-    error_msg = "Rule execution failed"
-    result = rule_result_factory(converted=0, skipped=0, success=False, error=error_msg)
-
-    assert result.success is False
-    assert result.error == error_msg
+    assert result.converted == converted
+    assert result.skipped == skipped
+    assert result.success is success
+    assert result.error == error
 
 
 def test_rule_result_is_immutable(rule_result_factory: Callable[..., RuleResult]) -> None:
     """RuleResult is frozen, so attribute assignment should raise."""
     result = rule_result_factory()
 
-    with pytest.raises(AttributeError):
+    with pytest.raises(FrozenInstanceError):
         result.converted = 10  # type: ignore
 
 
-def test_translation_result_creation(
+_DEFAULT_STATS = {
+    "total_rules": 1,
+    "successful_rules": 1,
+    "failed_rules": 0,
+    "total_converted": 0,
+    "time_series_transferred": 0,
+    "time_series_updated": 0,
+}
+
+
+@pytest.mark.parametrize(
+    "fields",
+    [
+        {"total_rules": 2, "successful_rules": 2, "failed_rules": 0, "total_converted": 8},
+        {"time_series_transferred": 10, "time_series_updated": 3},
+    ],
+    ids=["rule_stats", "time_series_stats"],
+)
+def test_translation_result_roundtrip(
     translation_result_factory: Callable[..., TranslationResult],
     rule_result_factory: Callable[..., RuleResult],
+    fields: dict[str, int],
 ) -> None:
-    """TranslationResult should aggregate statistics correctly."""
+    """TranslationResult returns the statistics it was built with and defaults the rest."""
     rule_results = [
         rule_result_factory(converted=5, skipped=1, success=True),
         rule_result_factory(converted=3, skipped=2, success=True),
     ]
-    result = translation_result_factory(
-        total_rules=2,
-        successful_rules=2,
-        failed_rules=0,
-        total_converted=8,
-        rule_results=rule_results,
-    )
-
-    assert result.total_rules == 2
-    assert result.successful_rules == 2
-    assert result.failed_rules == 0
-    assert result.total_converted == 8
-    assert len(result.rule_results) == 2
-    assert result.time_series_transferred == 0
-    assert result.time_series_updated == 0
-
-
-def test_translation_result_time_series_stats(
-    translation_result_factory: Callable[..., TranslationResult],
-) -> None:
-    """Time series statistics should be accessible on the result."""
-    result = translation_result_factory(
-        time_series_transferred=10,
-        time_series_updated=3,
-    )
+    result = translation_result_factory(rule_results=rule_results, **fields)
 
-    assert result.time_series_transferred == 10
-    assert result.time_series_updated == 3
+    expected = {**_DEFAULT_STATS, **fields}
+    assert {name: getattr(result, name) for name in expected} == expected
+    assert result.rule_results == rule_results
 
 
 @pytest.mark.parametrize("failed_rules,expected", [(0, True), (1, False)])
@@ -168,7 +168,7 @@ def test_translation_result_is_immutable(
     """TranslationResult is frozen like RuleResult."""
     result = translation_result_factory()
 
-    with pytest.raises(AttributeError):
+    with pytest.raises(FrozenInstanceError):
         result.total_rules = 2  # type: ignore
 
 
@@ -2,58 +2,89 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, cast
+import pickle
+from collections.abc import Callable
+from enum import Enum
+from types import SimpleNamespace as _Dummy
+from typing import Any, cast
 
+import pytest
 from fixtures.context import FIXTURE_MODEL_MODULES
 from fixtures.target_system import StationComponent
 
-if TYPE_CHECKING:
-    from r2x_core import RuleFilter, System
-
-
-class _Dummy:
-    def __init__(self, **attrs):
-        for key, value in attrs.items():
-            setattr(self, key, value)
-
-
-def test_rule_filter_matches_leaf_casefold():
-    """Leaf filters respect casefolded string comparisons."""
-    from r2x_core import RuleFilter
-    from r2x_core.utils import _evaluate_rule_filter
-
-    filt = RuleFilter(field="kind", op="eq", values=["gas"])
-    assert _evaluate_rule_filter(_Dummy(kind="GAS"), rule_filter=filt)
-
-
-def test_rule_filter_matches_any_of():
-    """Composite any_of evaluates to True when any child matches."""
-    from r2x_core import RuleFilter
-    from r2x_core.utils import _evaluate_rule_filter
-
-    filt = RuleFilter(
-        any_of=[
-            RuleFilter(field="kind", op="eq", values=["coal"]),
-            RuleFilter(field="kind", op="eq", values=["gas"]),
-        ]
-    )
-    assert _evaluate_rule_filter(_Dummy(kind="gas"), rule_filter=filt)
-
-
-def test_rule_filter_matches_geq_numeric():
-    """Numeric geq comparison works for thresholds."""
-    from r2x_core import RuleFilter
-    from r2x_core.utils import _evaluate_rule_filter
-
-    filt = RuleFilter(field="capacity", op="geq", values=[400])
-    assert _evaluate_rule_filter(_Dummy(capacity=500.0), rule_filter=filt)
-    assert not _evaluate_rule_filter(_Dummy(capacity=300), rule_filter=filt)
+from r2x_core import PluginConfig, PluginContext, Rule, RuleFilter, System, apply_rules_to_context
+
+_KIND_GAS = {"field": "kind", "op": "eq", "values": ["gas"]}
+_KIND_COAL = {"field": "kind", "op": "eq", "values": ["coal"]}
+_CAP_400 = {"field": "capacity", "op": "geq", "values": [400]}
+_KIND_GA = {"field": "kind", "op": "startswith", "values": ["ga"]}
+_KIND_NOT_GA = {"field": "kind", "op": "not_startswith", "values": ["ga"]}
+_NAME_ALPHA = {"field": "name", "op": "endswith", "values": ["alpha"]}
+_NAME_PLANT = {"field": "name", "op": "startswith", "values": ["plant_"]}
+_NAME_NOT_PLANT = {"field": "name", "op": "not_startswith", "values": ["plant_"]}
+
+
+@pytest.fixture(params=["matches", "compile"])
+def evaluate(request: pytest.FixtureRequest) -> Callable[[RuleFilter, Any], bool]:
+    """Evaluate a filter directly or through its compiled predicate."""
+    if request.param == "matches":
+        return lambda filt, component: filt.matches(component)
+    return lambda filt, component: filt.compile()(component)
+
+
+@pytest.mark.parametrize(
+    "spec,attrs,expected",
+    [
+        (_KIND_GAS, {"kind": "GAS"}, True),
+        ({"any_of": [_KIND_COAL, _KIND_GAS]}, {"kind": "gas"}, True),
+        (_CAP_400, {"capacity": 500.0}, True),
+        (_CAP_400, {"capacity": 300}, False),
+        (_KIND_GA, {"kind": "gas"}, True),
+        (_KIND_GA, {"kind": "coal"}, False),
+        (_KIND_NOT_GA, {"kind": "coal"}, True),
+        (_KIND_NOT_GA, {"kind": "gas"}, False),
+        (_NAME_ALPHA, {"name": "plant_alpha"}, True),
+        (_NAME_ALPHA, {"name": "plant_beta"}, False),
+        ({**_NAME_ALPHA, "values": ["ALPHA"]}, {"name": "plant_alpha"}, True),
+        ({**_NAME_ALPHA, "values": ["ALPHA"], "casefold": False}, {"name": "plant_alpha"}, False),
+        (_NAME_PLANT, {"name": "plant_alpha"}, True),
+        (_NAME_PLANT, {"name": "plant_beta"}, True),
+        (_NAME_PLANT, {"name": "station_alpha"}, False),
+        (_NAME_NOT_PLANT, {"name": "station_alpha"}, True),
+        (_NAME_NOT_PLANT, {"name": "plant_alpha"}, False),
+        (_NAME_NOT_PLANT, {"name": "plant_beta"}, False),
+    ],
+    ids=[
+        "eq_casefold",
+        "any_of",
+        "geq_above",
+        "geq_below",
+        "startswith_hit",
+        "startswith_miss",
+        "not_startswith_hit",
+        "not_startswith_miss",
+        "endswith_hit",
+        "endswith_miss",
+        "endswith_casefold",
+        "endswith_case_sensitive",
+        "prefix_alpha",
+        "prefix_beta",
+        "prefix_miss",
+        "not_prefix_hit",
+        "not_prefix_alpha",
+        "not_prefix_beta",
+    ],
+)
+def test_rule_filter_evaluation(
+    spec: dict[str, Any], attrs: dict[str, Any], expected: bool, evaluate: Callable[[RuleFilter, Any], bool]
+):
+    """Leaf and composite filters evaluate each op against component attributes."""
+    filt = RuleFilter.model_validate(spec)
+    assert evaluate(filt, _Dummy(**attrs)) is expected
 
 
 def _run_rule_with_filter(filter_spec: RuleFilter, source_system: System) -> tuple[int, System]:
     """Apply a single filtered rule and return conversion count and target system."""
-    from r2x_core import PluginConfig, PluginContext, Rule, System, apply_rules_to_context
-
     config = PluginConfig(models=FIXTURE_MODEL_MODULES)
     rule = Rule(
         source_type="PlantComponent",
@@ -77,8 +108,6 @@ def _run_rule_with_filter(filter_spec: RuleFilter, source_system: System) -> tup
 def test_apply_rules_respects_filter_include(source_system):
     """Inclusive filters allow matching components to convert."""
 
-    from r2x_core import RuleFilter
-
     converted, target_system = _run_rule_with_filter(
         RuleFilter(field="fuel_type", op="eq", values=["gas"]),
         source_system,
@@ -90,8 +119,6 @@ def test_apply_rules_respects_filter_include(source_system):
 
 def test_apply_rules_respects_filter_exclude(source_system):
     """Exclusive filters prevent matching components from converting."""
-    from r2x_core import RuleFilter
-
     converted, target_system = _run_rule_with_filter(
         RuleFilter(field="fuel_type", op="neq", values=["gas"]),
         source_system,
@@ -101,30 +128,8 @@ def test_apply_rules_respects_filter_exclude(source_system):
     assert not stations
 
 
-def test_rule_filter_startswith():
-    """Test that 'startswith' operator works for RuleFilter."""
-    from r2x_core import RuleFilter
-    from r2x_core.utils import _evaluate_rule_filter
-
-    filt = RuleFilter(field="kind", op="startswith", values=["ga"])
-    assert _evaluate_rule_filter(_Dummy(kind="gas"), rule_filter=filt)
-    assert not _evaluate_rule_filter(_Dummy(kind="coal"), rule_filter=filt)
-
-
-def test_rule_filter_not_startswith():
-    """Test that 'not_startswith' operator works for RuleFilter."""
-    from r2x_core import RuleFilter
-    from r2x_core.utils import _evaluate_rule_filter
-
-    filt = RuleFilter(field="kind", op="not_startswith", values=["ga"])
-    assert _evaluate_rule_filter(_Dummy(kind="coal"), rule_filter=filt)
-    assert not _evaluate_rule_filter(_Dummy(kind="gas"), rule_filter=filt)
-
-
 def test_apply_rules_respects_filter_prefix(source_system):
     """Rule filters with prefixes control conversion in the executor."""
-    from r2x_core import RuleFilter
-
     converted, target_system = _run_rule_with_filter(
         RuleFilter(field="name", op="startswith", prefixes=["plant_"]),
         source_system,
@@ -136,8 +141,6 @@ def test_apply_rules_respects_filter_prefix(source_system):
 
 def test_apply_rules_respects_filter_not_prefix(source_system):
     """Negative prefix filters block matching components."""
-    from r2x_core import RuleFilter
-
     converted, _ = _run_rule_with_filter(
         RuleFilter(field="name", op="not_startswith", prefixes=["plant_"]),
         source_system,
@@ -145,53 +148,8 @@ def test_apply_rules_respects_filter_not_prefix(source_system):
     assert converted == 0
 
 
-def test_rule_filter_matches_endswith():
-    """Leaf filters with endswith operator work as expected, including casefold."""
-    from r2x_core import RuleFilter
-    from r2x_core.utils import _evaluate_rule_filter
-
-    # Standard case
-    filt = RuleFilter(field="name", op="endswith", values=["alpha"])
-    assert _evaluate_rule_filter(_Dummy(name="plant_alpha"), rule_filter=filt)
-    assert not _evaluate_rule_filter(_Dummy(name="plant_beta"), rule_filter=filt)
-
-    # Casefolded match
-    filt_casefold = RuleFilter(field="name", op="endswith", values=["ALPHA"])
-    assert _evaluate_rule_filter(_Dummy(name="plant_alpha"), rule_filter=filt_casefold)
-
-    # Casefold disabled
-    filt_nocase = RuleFilter(field="name", op="endswith", values=["ALPHA"], casefold=False)
-    assert not _evaluate_rule_filter(_Dummy(name="plant_alpha"), rule_filter=filt_nocase)
-
-
-def test_rule_filter_matches_startswith():
-    """Leaf filters with startswith operator work as expected."""
-    from r2x_core import RuleFilter
-    from r2x_core.utils import _evaluate_rule_filter
-
-    filt = RuleFilter(field="name", op="startswith", values=["plant_"])
-    assert _evaluate_rule_filter(_Dummy(name="plant_alpha"), rule_filter=filt)
-    assert _evaluate_rule_filter(_Dummy(name="plant_beta"), rule_filter=filt)
-    assert not _evaluate_rule_filter(_Dummy(name="station_alpha"), rule_filter=filt)
-
-
-def test_rule_filter_matches_not_startswith():
-    """Leaf filters with not_startswith operator work as expected."""
-    from r2x_core import RuleFilter
-    from r2x_core.utils import _evaluate_rule_filter
-
-    filt = RuleFilter(field="name", op="not_startswith", values=["plant_"])
-    assert _evaluate_rule_filter(_Dummy(name="station_alpha"), rule_filter=filt)
-    assert not _evaluate_rule_filter(_Dummy(name="plant_alpha"), rule_filter=filt)
-    assert not _evaluate_rule_filter(_Dummy(name="plant_beta"), rule_filter=filt)
-
-
 def test_rulefilter_model_validator_leaf_and_children_error():
     """RuleFilter cannot mix leaf and composition."""
-    import pytest
-
-    from r2x_core import RuleFilter
-
     with pytest.raises(ValueError, match="cannot mix field/op/values with any_of/all_of"):
         RuleFilter(
             field="kind", op="eq", values=["gas"], any_of=[RuleFilter(field="kind", op="eq", values=["coal"])]
@@ -200,20 +158,12 @@ def test_rulefilter_model_validator_leaf_and_children_error():
 
 def test_rulefilter_model_validator_requires_leaf_or_composition():
     """RuleFilter requires either leaf or composition."""
-    import pytest
-
-    from r2x_core import RuleFilter
-
     with pytest.raises(ValueError, match="requires field/op/values or any_of/all_of"):
         RuleFilter()
 
 
 def test_rulefilter_model_validator_both_any_of_and_all_of_error():
     """RuleFilter cannot set both any_of and all_of."""
-    import pytest
-
-    from r2x_core import RuleFilter
-
     with pytest.raises(ValueError, match="cannot set both any_of and all_of"):
         RuleFilter(
             any_of=[RuleFilter(field="kind", op="eq", values=["coal"])],
@@ -223,65 +173,263 @@ def test_rulefilter_model_validator_both_any_of_and_all_of_error():
 
 def test_rulefilter_model_validator_leaf_field_required():
     """RuleFilter.field required for leaf filters."""
-    import pytest
-
-    from r2x_core import RuleFilter
-
     with pytest.raises(ValueError, match="field is required for leaf filters"):
         RuleFilter(op="eq", values=["gas"])
 
 
 def test_rulefilter_model_validator_leaf_op_required():
     """RuleFilter.op required for leaf filters."""
-    import pytest
-
-    from r2x_core import RuleFilter
-
     with pytest.raises(ValueError, match="op is required for leaf filters"):
         RuleFilter(field="kind", values=["gas"])
 
 
 def test_rulefilter_model_validator_leaf_values_required():
     """RuleFilter.values or prefixes required for leaf filters."""
-    import pytest
-
-    from r2x_core import RuleFilter
-
     with pytest.raises(ValueError, match="must contain at least one value"):
         RuleFilter(field="kind", op="eq")
 
 
 def test_rulefilter_model_validator_geq_one_value():
     """RuleFilter.geq expects exactly one comparison value."""
-    import pytest
-
-    from r2x_core import RuleFilter
-
     with pytest.raises(ValueError, match="expects exactly one comparison value"):
         RuleFilter(field="capacity", op="geq", values=[1, 2])
 
 
 def test_rulefilter_model_validator_prefixes_type():
     """RuleFilter.prefixes entries must be strings."""
-    import pytest
-
-    from r2x_core import RuleFilter
-
     with pytest.raises(ValueError) as _:
         RuleFilter(field="name", op="startswith", prefixes=cast(Any, [123]))
 
 
 def test_rulefilter_normalized_prefixes_casefold():
     """normalized_prefixes returns casefolded values if casefold=True."""
-    from r2x_core import RuleFilter
-
     filt = RuleFilter(field="name", op="startswith", values=["Plant_A"], casefold=True)
     assert filt.normalized_prefixes() == ["plant_a"]
 
 
 def test_rulefilter_normalized_prefixes_no_casefold():
     """normalized_prefixes returns original values if casefold=False."""
-    from r2x_core import RuleFilter
-
     filt = RuleFilter(field="name", op="startswith", values=["Plant_A"], casefold=False)
     assert filt.normalized_prefixes() == ["Plant_A"]
+
+
+def test_rulefilter_compile_reflects_current_fields():
+    """compile() builds a fresh predicate from the fields it sees."""
+    filt = RuleFilter(field="kind", op="eq", values=["gas"])
+    assert filt.compile()(_Dummy(kind="Gas"))
+
+    filt.values = ["coal"]
+    assert filt.compile()(_Dummy(kind="coal"))
+    assert not filt.matches(_Dummy(kind="gas"))
+
+
+def test_rulefilter_equality_unaffected_by_evaluation():
+    """Evaluating a filter leaves no state that changes model equality."""
+    evaluated = RuleFilter(any_of=[RuleFilter(field="kind", op="eq", values=["gas"])])
+    fresh = RuleFilter(any_of=[RuleFilter(field="kind", op="eq", values=["gas"])])
+
+    assert evaluated.matches(_Dummy(kind="gas"))
+    evaluated.compile()
+    assert evaluated == fresh
+
+
+def test_rulefilter_pickles_after_evaluation():
+    """A filter that has been evaluated still pickles and round-trips."""
+    filt = RuleFilter(field="kind", op="eq", values=["gas"])
+    assert filt.matches(_Dummy(kind="gas"))
+
+    restored = pickle.loads(pickle.dumps(filt))
+    assert restored == filt
+    assert restored.matches(_Dummy(kind="GAS"))
+
+
+def test_rulefilter_model_copy_after_evaluation_uses_new_values():
+    """model_copy(update=...) on an evaluated filter matches against the new values."""
+    filt = RuleFilter(field="kind", op="eq", values=["gas"])
+    assert filt.matches(_Dummy(kind="gas"))
+
+    copied = filt.model_copy(update={"values": ["coal"]})
+    assert copied.matches(_Dummy(kind="Coal"))
+    assert not copied.matches(_Dummy(kind="gas"))
+    assert filt.matches(_Dummy(kind="gas"))
+
+
+def test_rulefilter_values_mutated_in_place_are_seen():
+    """Appending to values after evaluation changes what the filter matches."""
+    filt = RuleFilter(field="name", op="startswith", prefixes=["plant_"])
+    assert not filt.matches(_Dummy(name="Station_1"))
+
+    cast(list[Any], filt.values).append("Station_")
+    assert filt.normalized_prefixes() == ["plant_", "station_"]
+    assert filt.matches(_Dummy(name="Station_1"))
+
+
+def test_rulefilter_parent_sees_mutated_child():
+    """Reassigning a nested child's values after evaluation changes the parent's result."""
+    child = RuleFilter(field="kind", op="eq", values=["gas"])
+    parent = RuleFilter(all_of=[child])
+    assert parent.matches(_Dummy(kind="gas"))
+
+    child.values = ["coal"]
+    assert parent.matches(_Dummy(kind="coal"))
+    assert not parent.matches(_Dummy(kind="gas"))
+
+
+def test_rule_filter_composite_checks_leaves_before_nested():
+    """A compiled any_of tries a matching leaf before evaluating a nested composite."""
+
+    class Plant:
+        def __init__(self, kind: str) -> None:
+            self.kind = kind
+            self.zone_reads = 0
+
+        @property
+        def zone(self) -> str:
+            self.zone_reads += 1
+            return "north"
+
+    nested = RuleFilter(all_of=[RuleFilter(field="zone", op="eq", values=["north"])])
+    filt = RuleFilter(any_of=[nested, RuleFilter(field="kind", op="eq", values=["gas"])])
+
+    predicate = filt.compile()
+    gas = Plant("gas")
+    assert predicate(gas)
+    assert gas.zone_reads == 0
+
+    coal = Plant("coal")
+    assert predicate(coal)
+    assert coal.zone_reads == 1
+
+
+def test_rule_filter_dotted_field_is_a_plain_attribute_name():
+    """A dotted field is read as one attribute name, not followed as a nested path."""
+    filt = RuleFilter(field="bus.name", op="eq", values=["north"])
+    literal = _Dummy()
+    setattr(literal, "bus.name", "North")
+
+    assert filt.matches(literal)
+    assert filt.compile()(literal)
+    assert not filt.matches(_Dummy(bus=_Dummy(name="North")))
+    assert not filt.compile()(_Dummy(bus=_Dummy(name="North")))
+
+
+@pytest.mark.parametrize("casefold", [True, False])
+@pytest.mark.parametrize("op", ["eq", "startswith"])
+@pytest.mark.parametrize("on_missing", ["include", "exclude"])
+def test_rule_filter_missing_attribute_follows_on_missing(
+    op: str, on_missing: str, casefold: bool, evaluate: Callable[[RuleFilter, Any], bool]
+):
+    """Absent and None attributes both resolve to the on_missing policy."""
+    filt = RuleFilter(
+        field="kind", op=cast(Any, op), values=["gas"], on_missing=cast(Any, on_missing), casefold=casefold
+    )
+    expected = on_missing == "include"
+    assert evaluate(filt, _Dummy()) is expected
+    assert evaluate(filt, _Dummy(kind=None)) is expected
+
+
+def test_rulefilter_prefixes_take_precedence_over_values():
+    """Prefixes replace values, so normalization and matching use the prefixes."""
+    filt = RuleFilter(field="name", op="startswith", values=["zz"], prefixes=["Plant_"])
+    assert filt.normalized_prefixes() == ["plant_"]
+    assert filt.matches(_Dummy(name="PLANT_1"))
+
+
+@pytest.mark.parametrize(
+    "values,candidate,expected",
+    [
+        (["gas", "coal"], "COAL", True),
+        (["gas", "coal"], "wind", False),
+        ([["a"], "gas"], "gas", True),
+        (["gas"], ["gas"], False),
+    ],
+    ids=["hashable_hit", "hashable_miss", "unhashable_values", "unhashable_candidate"],
+)
+def test_rule_filter_in_membership(
+    values: list[Any], candidate: Any, expected: bool, evaluate: Callable[[RuleFilter, Any], bool]
+):
+    """in/not_in agree with list membership whether or not values are hashable."""
+    component = _Dummy(kind=candidate)
+    assert evaluate(RuleFilter(field="kind", op="in", values=values), component) is expected
+    assert evaluate(RuleFilter(field="kind", op="not_in", values=values), component) is not expected
+
+
+def test_rule_filter_composite_orders_children_by_cost():
+    """Compiled composites read cheapest children first, keeping declared order on ties."""
+
+    class Recorder:
+        def __init__(self, **attrs: Any) -> None:
+            self.reads: list[str] = []
+            self.attrs = attrs
+
+        def __getattr__(self, name: str) -> Any:
+            self.reads.append(name)
+            return self.attrs[name]
+
+    filt = RuleFilter(
+        all_of=[
+            RuleFilter(any_of=[RuleFilter(field="fuel", op="eq", values=["gas"])]),
+            RuleFilter(field="name", op="startswith", values=["plant"]),
+            RuleFilter(field="capacity", op="geq", values=[10]),
+            RuleFilter(field="kind", op="in", values=["thermal"]),
+            RuleFilter(field="zone", op="eq", values=["north"]),
+        ]
+    )
+    attrs = {"fuel": "gas", "name": "plant_1", "capacity": 20, "kind": "thermal", "zone": "north"}
+
+    compiled = Recorder(**attrs)
+    assert filt.compile()(compiled)
+    assert compiled.reads == ["kind", "zone", "capacity", "name", "fuel"]
+
+    direct = Recorder(**attrs)
+    assert filt.matches(direct)
+    assert direct.reads == ["fuel", "name", "capacity", "kind", "zone"]
+
+
+@pytest.mark.parametrize(
+    "op,name,expected",
+    [
+        ("startswith", "Solar_1", True),
+        ("startswith", "coal_1", False),
+        ("not_startswith", "Wind_2", False),
+        ("not_startswith", "coal_1", True),
+        ("endswith", "unit_PV", True),
+        ("endswith", "unit_st", False),
+    ],
+)
+def test_rule_filter_affix_ops_with_several_values(
+    op: str, name: str, expected: bool, evaluate: Callable[[RuleFilter, Any], bool]
+):
+    """Prefix and suffix ops match when any of several values applies."""
+    values = ["_pv", "_wt"] if op == "endswith" else ["solar_", "wind_"]
+    filt = RuleFilter(field="name", op=cast(Any, op), values=values)
+    assert evaluate(filt, _Dummy(name=name)) is expected
+
+
+def test_rule_filter_eq_case_sensitive(evaluate: Callable[[RuleFilter, Any], bool]):
+    """casefold=False compares equality on the raw attribute value."""
+    filt = RuleFilter(field="kind", op="eq", values=["Gas"], casefold=False)
+    assert evaluate(filt, _Dummy(kind="Gas"))
+    assert not evaluate(filt, _Dummy(kind="gas"))
+
+
+class Fuel(str, Enum):  # noqa: UP042 - the str mixin is the case under test
+    GAS = "gas"
+
+
+@pytest.mark.parametrize(
+    "op,values,casefold,expected",
+    [
+        ("eq", ["gas"], True, False),
+        ("startswith", ["ga"], True, False),
+        ("eq", ["fuel.gas"], True, True),
+        ("eq", ["gas"], False, True),
+    ],
+    ids=["eq_casefold", "startswith_casefold", "eq_casefold_str_form", "eq_exact_value"],
+)
+def test_rule_filter_str_enum_attribute(
+    op: str, values: list[str], casefold: bool, expected: bool, evaluate: Callable[[RuleFilter, Any], bool]
+):
+    """Casefolded comparisons use str() of the attribute, so str enums compare by their name form."""
+    filt = RuleFilter(field="fuel", op=cast(Any, op), values=values, casefold=casefold)
+    assert evaluate(filt, _Dummy(fuel=Fuel.GAS)) is expected
@@ -1,4 +1,11 @@
+from dataclasses import FrozenInstanceError
+from types import SimpleNamespace
+from typing import Any
+
 import pytest
+from rust_ok import Ok, Result
+
+from r2x_core import Rule, RuleFilter
 
 
 def test_simple_rule_creation(rules_simple):
@@ -20,8 +27,6 @@ def test_simple_rule_creation(rules_simple):
 
 def test_multifield_rule_requires_getter():
     """Multi-field mapping without getter raises ValueError."""
-    from r2x_core import Rule
-
     with pytest.raises(ValueError, match=r"Multi-field mapping .* requires a getter"):
         Rule(
             source_type="Gen",
@@ -36,9 +41,6 @@ def test_multifield_rule_requires_getter():
 
 def test_validation_with_multiple_multifield_mappings():
     """Validation checks all multi-field mappings."""
-    from rust_ok import Ok, Result
-
-    from r2x_core import Rule
 
     def field_getter(_src: object, *, context: object) -> Result[int, ValueError]:
         _ = context
@@ -61,8 +63,6 @@ def test_validation_with_multiple_multifield_mappings():
 
 def test_rule_is_frozen(rules_simple):
     """Verify rule is frozen (immutable)."""
-    from dataclasses import FrozenInstanceError
-
     rule_simple = rules_simple[0]
     with pytest.raises(FrozenInstanceError):
         rule_simple.version = 2
@@ -79,8 +79,6 @@ def test_rule_is_frozen(rules_simple):
 )
 def test_defaults_are_optional(defaults, expected):
     """Defaults are optional and default to empty dict."""
-    from r2x_core import Rule
-
     rule = Rule(
         source_type="A",
         target_type="B",
@@ -94,22 +92,19 @@ def test_defaults_are_optional(defaults, expected):
 
 def test_rule_hash_and_equality():
     """Two rules with the same identity hash equal each other."""
-    from r2x_core import Rule
-
-    rule_a = Rule(source_type="A", target_type="B", version=1)
-    rule_b = Rule(source_type="A", target_type="B", version=1)
+    rule_a = Rule(source_type="A", target_type="B", version=1, field_map={"name": "name"})
+    rule_b = Rule(source_type="A", target_type="B", version=1, field_map={"name": "name", "extra": "extra"})
     rule_c = Rule(source_type=["A"], target_type="B", version=2)
 
     assert hash(rule_a) == hash(rule_b)
     assert rule_a == rule_b
+    assert len({rule_a, rule_b}) == 1
     assert rule_a != rule_c
     assert (rule_a == "not a rule") is False
 
 
 def test_rule_get_source_target_types_and_lists():
     """Source/target helpers should normalize to lists."""
-    from r2x_core import Rule
-
     rule = Rule(source_type="A", target_type=["B", "C"], version=1)
     assert rule.get_source_types() == ["A"]
     assert rule.get_target_types() == ["B", "C"]
@@ -117,22 +112,44 @@ def test_rule_get_source_target_types_and_lists():
     assert not rule.has_multiple_sources()
 
 
+def test_rule_type_lists_are_copies():
+    """Mutating a returned type list leaves the rule and its equality unchanged."""
+    rule = Rule(source_type="A", target_type=["B", "C"], version=1)
+    twin = Rule(source_type="A", target_type=["B", "C"], version=1)
+
+    rule.get_source_types().append("X")
+    targets = rule.get_target_types()
+    targets.sort(reverse=True)
+    targets.append("D")
+
+    assert rule.get_source_types() == ["A"]
+    assert rule.get_target_types() == ["B", "C"]
+    assert rule.target_type == ["B", "C"]
+    assert rule == twin
+    assert hash(rule) == hash(twin)
+
+
 def test_rule_rejects_multi_source_and_multi_target():
     """Rules cannot declare both multiple sources and targets."""
-    from r2x_core import Rule
-
-    with pytest.raises(NotImplementedError):
+    with pytest.raises(NotImplementedError, match="cannot have both multiple sources and multiple targets"):
         Rule(source_type=["A", "B"], target_type=["C", "D"], version=1)
 
 
-def test_rule_from_records_processes_string_getters_and_filters():
-    """from_records resolves string getter specs and filters."""
-    from types import SimpleNamespace
+@pytest.mark.parametrize("getter", ["not_callable", "bus.name", 42], ids=["name", "dotted_path", "int"])
+def test_rule_rejects_non_callable_getter(getter: Any):
+    """Getters are checked once when the rule is built; strings are only resolved by from_records."""
+    with pytest.raises(TypeError, match="Getter for 'computed' is not callable"):
+        Rule(source_type="A", target_type="B", version=1, getters={"computed": getter})
 
-    from rust_ok import Ok
 
-    from r2x_core import Rule, RuleFilter
+def test_rule_rejects_non_rule_filter():
+    """Rule.filter must be a RuleFilter."""
+    with pytest.raises(TypeError, match="must be a RuleFilter"):
+        Rule(source_type="A", target_type="B", version=1, field_map={}, filter="not_a_filter")  # type: ignore[arg-type]
 
+
+def test_rule_from_records_processes_string_getters_and_filters():
+    """from_records resolves string getter specs and filters."""
     records = [
         {
             "source_type": "Source",
@@ -148,18 +165,13 @@ def test_rule_from_records_processes_string_getters_and_filters():
     assert len(rules) == 1
     rule = rules[0]
     assert isinstance(rule.filter, RuleFilter)
-    getter_fn = rule.getters["nested_name"]
-    if callable(getter_fn):
-        result = getter_fn(SimpleNamespace(child=SimpleNamespace(name="x")), context=None)
-        assert isinstance(result, Ok)
+    result = rule.getters["nested_name"](SimpleNamespace(child=SimpleNamespace(name="x")), context=None)
+    assert result.is_ok()
+    assert result.unwrap() == "x"
 
 
 def test_rule_filter_pattern_variants():
     """RuleFilter should validate structure and evaluate operations."""
-    from types import SimpleNamespace
-
-    from r2x_core import RuleFilter
-
     base = SimpleNamespace(name="Alpha", status="ok", count=5)
 
     leaf = RuleFilter(field="name", op="eq", values=["alpha"])
@@ -2,21 +2,15 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
-
 import pytest
 from fixtures.context import FIXTURE_MODEL_MODULES
+from fixtures.target_system import CircuitComponent, NodeComponent, StationComponent
 
-if TYPE_CHECKING:
-    from r2x_core import PluginContext
+from r2x_core import PluginConfig, PluginContext, Rule, apply_rules_to_context
 
 
 def test_convert_rule_single_component(context_example: PluginContext):
     """convert_rule applies a rule to all matching source components."""
-    from fixtures.target_system import CircuitComponent, NodeComponent, StationComponent
-
-    from r2x_core import apply_rules_to_context
-
     result = apply_rules_to_context(context_example)
 
     assert result.success
@@ -44,8 +38,6 @@ def test_convert_rule_single_component(context_example: PluginContext):
 
 def test_apply_rules_requires_non_empty_rule_list(source_system, target_system):
     """Plugin context without rules raises ValueError."""
-    from r2x_core import PluginConfig, PluginContext, apply_rules_to_context
-
     context = PluginContext(
         source_system=source_system,
         target_system=target_system,
@@ -60,8 +52,6 @@ def test_apply_rules_requires_non_empty_rule_list(source_system, target_system):
 
 def test_apply_rules_reports_resolution_errors(source_system, target_system):
     """Failed component resolution surfaces as failed rule result."""
-    from r2x_core import PluginConfig, PluginContext, Rule, apply_rules_to_context
-
     invalid_rule = Rule(
         source_type="MissingComponent",
         target_type="NodeComponent",
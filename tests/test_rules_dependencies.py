@@ -221,6 +221,7 @@ def test_topological_sort_circular_dependency():
 
     assert result.is_err()
     assert "Circular dependencies" in str(result.err())
+    assert str(result.err()).endswith("rule_a, rule_b")
 
 
 def test_topological_sort_unknown_dependency():
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from types import SimpleNamespace
 from typing import Any, cast
 
 import pytest
@@ -10,10 +11,11 @@ from fixtures.source_system import BusComponent
 from fixtures.target_system import NodeComponent
 from rust_ok import Err, Ok, Result
 
-from r2x_core import Rule
+from r2x_core import PluginConfig, PluginContext, Rule, RuleFilter
 from r2x_core.utils import (
     _build_target_fields,
     _create_target_component,
+    _evaluate_rule_filter,
     _make_attr_getter,
     _resolve_component_type,
     build_component_kwargs,
@@ -36,17 +38,19 @@ def test_resolve_component_type_missing_returns_error(context_example):
     assert "NotAComponent" in str(result.err())
 
 
-def test_make_attr_getter_traverses_chain():
-    """Attr getter walks nested attributes and returns Ok result."""
+def test_resolve_component_type_cache_is_scoped_to_models(context_example):
+    """A type cached for one context is not visible to a context searching other modules."""
+    assert _resolve_component_type("BusComponent", context=context_example).is_ok()
+    target_only = PluginContext(config=PluginConfig(models=("fixtures.target_system",)))
 
-    class Inner:
-        value = 99
+    assert _resolve_component_type("BusComponent", context=target_only).is_err()
 
-    class Outer:
-        inner = Inner()
+
+def test_make_attr_getter_traverses_chain():
+    """Attr getter walks nested attributes and returns Ok result."""
 
     getter = _make_attr_getter(["inner", "value"])
-    result = getter(Outer(), context=cast(Any, None))
+    result = getter(SimpleNamespace(inner=SimpleNamespace(value=99)), context=cast(Any, None))
 
     assert result.is_ok()
     assert result.unwrap() == 99
@@ -55,10 +59,6 @@ def test_make_attr_getter_traverses_chain():
 def test_build_target_fields_applies_defaults_and_getters(context_example):
     """Missing attributes fall back to defaults and getters override values."""
 
-    class Source:
-        name = "comp_a"
-        demand = None
-
     def area_getter(_src: Any, *, context: Any) -> Result[str, ValueError]:
         _ = context
         return Ok("north")
@@ -72,7 +72,8 @@ def test_build_target_fields_applies_defaults_and_getters(context_example):
         defaults={"demand_mw": 0.0},
     )
 
-    result = _build_target_fields(Source(), rule=rule, context=context_example)
+    source = SimpleNamespace(name="comp_a", demand=None)
+    result = _build_target_fields(source, rule=rule, context=context_example)
 
     assert result.is_ok()
     fields = result.unwrap()
@@ -84,9 +85,6 @@ def test_build_target_fields_applies_defaults_and_getters(context_example):
 def test_build_target_fields_missing_attribute_without_default(context_example):
     """Missing attributes without defaults produce an error."""
 
-    class Source:
-        pass
-
     rule = Rule(
         source_type="SourceType",
         target_type="TargetType",
@@ -94,16 +92,18 @@ def test_build_target_fields_missing_attribute_without_default(context_example):
         field_map={"required": "missing_attr"},
     )
 
-    result = _build_target_fields(Source(), rule=rule, context=context_example)
+    result = _build_target_fields(SimpleNamespace(), rule=rule, context=context_example)
     assert result.is_err()
     assert "missing_attr" in str(result.err())
 
 
-def test_build_target_fields_getter_error_without_default(context_example):
-    """Getter failures propagate when no default is defined."""
-
-    class Source:
-        value = "x"
+@pytest.mark.parametrize(
+    "defaults,expected",
+    [({}, None), ({"computed": "fallback_value"}, "fallback_value")],
+    ids=["no_default", "default"],
+)
+def test_build_target_fields_getter_error(context_example, defaults, expected):
+    """Getter failures fall back to defaults when defined and propagate otherwise."""
 
     def faulty_getter(_src: Any, *, context: Any) -> Result[Any, ValueError]:
         _ = context
@@ -115,30 +115,62 @@ def test_build_target_fields_getter_error_without_default(context_example):
         version=1,
         field_map={"value": "value"},
         getters={"computed": faulty_getter},
+        defaults=defaults,
+    )
+
+    result = _build_target_fields(SimpleNamespace(value="x"), rule=rule, context=context_example)
+
+    if expected is None:
+        assert result.is_err()
+        assert "failed" in str(result.err()).lower()
+    else:
+        assert result.unwrap()["computed"] == expected
+
+
+def test_build_component_kwargs_non_callable_getter_rejected(context_example):
+    """Non-callable getter entries on rule-like objects return an error."""
+    rule_like = SimpleNamespace(
+        field_map={"value": "value"}, getters={"computed": "not_callable"}, defaults={}
     )
 
-    result = _build_target_fields(Source(), rule=rule, context=context_example)
+    result = build_component_kwargs({"value": 1}, rule=rule_like, context=context_example)
     assert result.is_err()
-    assert "failed" in str(result.err()).lower()
+    assert "not callable" in str(result.err())
+
 
+class _TaggedOk(Ok):
+    """Ok subclass standing in for a getter library's own result types."""
 
-def test_build_target_fields_non_callable_getter_rejected(context_example):
-    """Non-callable getter entries raise an error."""
 
-    class Source:
-        value = 1
+class _TaggedErr(Err):
+    """Err subclass standing in for a getter library's own result types."""
 
+
+def test_build_component_kwargs_accepts_result_subclasses(context_example):
+    """Getter results are dispatched by isinstance, so Ok/Err subclasses are honoured."""
     rule = Rule(
-        source_type="SourceType",
-        target_type="TargetType",
+        source_type="ParserRecord",
+        target_type="StationComponent",
         version=1,
-        field_map={"value": "value"},
-        getters={"computed": "not_callable"},
+        getters={
+            "x": lambda src, *, context: _TaggedOk(5),
+            "y": lambda src, *, context: _TaggedErr(ValueError("boom")),
+        },
+        defaults={"y": 7},
     )
 
-    result = _build_target_fields(Source(), rule=rule, context=context_example)
-    assert result.is_err()
-    assert "not callable" in str(result.err())
+    result = build_component_kwargs({}, rule=rule, context=context_example)
+    assert result.unwrap() == {"x": 5, "y": 7}
+
+    no_default = Rule(
+        source_type="ParserRecord",
+        target_type="StationComponent",
+        version=1,
+        getters={"y": lambda src, *, context: _TaggedErr(ValueError("boom"))},
+    )
+    failed = build_component_kwargs({}, rule=no_default, context=context_example)
+    assert failed.is_err()
+    assert "boom" in str(failed.err())
 
 
 def test_create_target_component_instantiates_class():
@@ -198,27 +230,32 @@ def test_build_component_kwargs_from_parser_record(context_example):
     assert kwargs["ramp_limits"].down == pytest.approx(0.12)
 
 
+def test_build_component_kwargs_accepts_rule_like_objects(context_example):
+    """Any object exposing field_map/getters/defaults works, not only Rule."""
+    rule_like = SimpleNamespace(
+        field_map={"name": "name", "combined": ["a", "b"]},
+        getters={},
+        defaults={"area": "west"},
+    )
+    result = build_component_kwargs({"name": "n1"}, rule=rule_like, context=context_example)
+
+    assert result.unwrap() == {"name": "n1"}
+
+
 def test_make_attr_getter_returns_none_when_chain_breaks():
     """Attr getter returns Ok(None) when attribute is None mid-chain."""
 
-    class Outer:
-        inner = None
-
     getter = _make_attr_getter(["inner", "value"])
-    result = getter(Outer(), context=cast(Any, None))
+    result = getter(SimpleNamespace(inner=None), context=cast(Any, None))
 
     assert result.is_ok()
     assert result.unwrap() is None
+    assert getter(object(), context=cast(Any, None)).unwrap() is None
 
 
 def test_build_target_fields_skips_multifield_mappings(context_example):
     """Multi-field mappings in field_map are skipped for direct assignment."""
 
-    class Source:
-        name = "source_name"
-        x_coord = 10.0
-        y_coord = 20.0
-
     def coords_getter(src: Any, *, context: Any) -> Result[tuple, ValueError]:
         _ = context
         return Ok((src.x_coord, src.y_coord))
@@ -231,7 +268,8 @@ def test_build_target_fields_skips_multifield_mappings(context_example):
         getters={"coords": coords_getter},
     )
 
-    result = _build_target_fields(Source(), rule=rule, context=context_example)
+    source = SimpleNamespace(name="source_name", x_coord=10.0, y_coord=20.0)
+    result = _build_target_fields(source, rule=rule, context=context_example)
 
     assert result.is_ok()
     kwargs = result.unwrap()
@@ -239,40 +277,8 @@ def test_build_target_fields_skips_multifield_mappings(context_example):
     assert kwargs["coords"] == (10.0, 20.0)
 
 
-def test_build_target_fields_getter_error_uses_default(context_example):
-    """Getter failures fall back to defaults when defined."""
-
-    class Source:
-        value = "x"
-
-    def faulty_getter(_src: Any, *, context: Any) -> Result[Any, ValueError]:
-        _ = context
-        return Err(ValueError("boom"))
-
-    rule = Rule(
-        source_type="SourceType",
-        target_type="TargetType",
-        version=1,
-        field_map={"value": "value"},
-        getters={"computed": faulty_getter},
-        defaults={"computed": "fallback_value"},
-    )
-
-    result = _build_target_fields(Source(), rule=rule, context=context_example)
-
-    assert result.is_ok()
-    kwargs = result.unwrap()
-    assert kwargs["computed"] == "fallback_value"
-
-
 def test_evaluate_rule_filter_all_of():
     """Test _evaluate_rule_filter with all_of composite filter."""
-    from r2x_core import RuleFilter
-    from r2x_core.utils import _evaluate_rule_filter
-
-    class Component:
-        kind = "gas"
-        capacity = 500
 
     filt = RuleFilter(
         all_of=[
@@ -281,22 +287,12 @@ def test_evaluate_rule_filter_all_of():
         ]
     )
 
-    assert _evaluate_rule_filter(Component(), rule_filter=filt)
-
-    class FailComponent:
-        kind = "gas"
-        capacity = 300
-
-    assert not _evaluate_rule_filter(FailComponent(), rule_filter=filt)
+    assert _evaluate_rule_filter(SimpleNamespace(kind="gas", capacity=500), rule_filter=filt)
+    assert not _evaluate_rule_filter(SimpleNamespace(kind="gas", capacity=300), rule_filter=filt)
 
 
 def test_evaluate_rule_filter_incomplete_raises():
     """Test _evaluate_rule_filter raises on incomplete leaf filter."""
-    from r2x_core import RuleFilter
-    from r2x_core.utils import _evaluate_rule_filter
-
-    class Component:
-        kind = "gas"
 
     filt = RuleFilter.__new__(RuleFilter)
     object.__setattr__(filt, "any_of", None)
@@ -309,17 +305,12 @@ def test_evaluate_rule_filter_incomplete_raises():
     object.__setattr__(filt, "on_missing", "exclude")
 
     with pytest.raises(ValueError, match="must have field, op, and values"):
-        _evaluate_rule_filter(Component(), rule_filter=filt)
+        _evaluate_rule_filter(SimpleNamespace(kind="gas"), rule_filter=filt)
 
 
 def test_evaluate_rule_filter_geq_non_numeric():
     """Test _evaluate_rule_filter geq returns False for non-numeric values."""
-    from r2x_core import RuleFilter
-    from r2x_core.utils import _evaluate_rule_filter
-
-    class Component:
-        capacity = "not_a_number"
 
     filt = RuleFilter(field="capacity", op="geq", values=[100])
 
-    assert not _evaluate_rule_filter(Component(), rule_filter=filt)
+    assert not _evaluate_rule_filter(SimpleNamespace(capacity="not_a_number"), rule_filter=filt)
@@ -195,6 +195,41 @@ def test_to_json_serialization(data_store_example, tmp_path, folder_with_data):
     assert "test2" in new_store
 
 
+def test_to_json_writes_non_finite_floats_as_null(tmp_path, folder_with_data):
+    from r2x_core import DataFile, DataStore
+    from r2x_core.datafile import TabularProcessing
+
+    store = DataStore(folder_with_data)
+    proc_spec = TabularProcessing(fill_null={"nan": float("nan"), "inf": float("inf")})
+    store.add_data([DataFile(name="test1", fpath=folder_with_data / "file1.csv", proc_spec=proc_spec)])
+
+    json_path = tmp_path / "config.json"
+    store.to_json(fpath=json_path)
+
+    with open(json_path) as f:
+        data = json.load(f)
+    assert data[0]["proc_spec"]["fill_null"] == {"nan": None, "inf": None}
+
+    new_store = DataStore.from_json(json_path, path=folder_with_data)
+    assert new_store["test1"].proc_spec.fill_null == {"nan": None, "inf": None}
+
+
+def test_from_json_accepts_non_finite_literals(tmp_path, folder_with_data):
+    import math
+
+    from r2x_core import DataStore
+
+    json_path = tmp_path / "config.json"
+    json_path.write_text(
+        '[{"name": "test1", "fpath": "file1.csv", "proc_spec": {"fill_null": {"a": NaN, "b": Infinity}}}]'
+    )
+
+    store = DataStore.from_json(json_path, path=folder_with_data)
+    fill_null = store["test1"].proc_spec.fill_null
+    assert math.isnan(fill_null["a"])
+    assert fill_null["b"] == math.inf
+
+
 def test_from_data_files_constructor(data_store_example, folder_with_data):
     from r2x_core import DataFile, DataStore
 
@@ -208,13 +243,16 @@ def test_from_data_files_constructor(data_store_example, folder_with_data):
     assert data is not None
 
 
-def test_from_data_files_constructor_with_relative_paths(data_store_example, folder_with_data, caplog):
+def test_from_data_files_constructor_with_relative_paths(
+    data_store_example, folder_with_data, caplog, tmp_path, monkeypatch
+):
     from pathlib import Path
 
     import polars as pl
 
     from r2x_core import DataFile, DataStore
 
+    monkeypatch.chdir(tmp_path)
     (Path.cwd() / "local_file.csv").write_text("col1,col2\n1,2\n3,4")
     df_01 = DataFile(name="test1", relative_fpath="file1.csv")
     df_02 = DataFile(name="test2", relative_fpath="file2.csv")
@@ -101,3 +101,10 @@ def test_unitspec_no_base_field():
 
     model3 = SimpleModel(voltage={"value": 13800.0, "unit": "V"})  # type: ignore[arg-type]
     assert model3.voltage == 13800.0
+
+
+def test_unitspec_is_slotted():
+    """UnitSpec instances carry no per-instance __dict__."""
+    spec = UnitSpec(unit="MW")
+    assert not hasattr(spec, "__dict__")
+    assert spec == UnitSpec(unit="MW")
@@ -6,6 +6,7 @@ from r2x_core.utils import (
     run_upgrade_step,
     shall_we_upgrade,
 )
+from r2x_core.utils._upgrader import _ACCEPTS_CONTEXT_CACHE, _accepts_upgrader_context
 from r2x_core.versioning import SemanticVersioningStrategy
 
 
@@ -83,3 +84,34 @@ def test_run_upgrade_step_wraps_exceptions():
     result = run_upgrade_step("ignored", step=step)
     assert result.is_err()
     assert "Failed broken-step" in result.err()
+
+
+def test_accepts_upgrader_context_caches_per_function():
+    def plain_step(data):
+        return data
+
+    def kwargs_step(data, **kwargs):
+        return data
+
+    assert _accepts_upgrader_context(plain_step) is False
+    assert _accepts_upgrader_context(kwargs_step) is True
+    assert _ACCEPTS_CONTEXT_CACHE[plain_step] is False
+    assert _ACCEPTS_CONTEXT_CACHE[kwargs_step] is True
+
+
+def test_run_upgrade_step_with_non_weakrefable_callable():
+    class SlottedStep:
+        __slots__ = ()
+
+        def __call__(self, data, upgrader_context=None):
+            return (data, upgrader_context)
+
+    step = UpgradeStep(
+        name="slotted-step",
+        func=SlottedStep(),
+        target_version="1.0",
+        upgrade_type=UpgradeType.FILE,
+    )
+
+    result = run_upgrade_step(1, step=step, upgrader_context="ctx")
+    assert result.unwrap() == (1, "ctx")
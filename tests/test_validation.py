@@ -204,11 +204,8 @@ class TestValidateFileExtension:
         """Test validate_file_extension error message contains supported formats."""
         path = Path("data.xyz")
         info = MagicMock()
-        with pytest.raises(KeyError) as exc_info:
+        with pytest.raises(KeyError, match=r"(?s)EXTENSION_MAPPING.*FileFormat"):
             validate_file_extension(path, info=info)
-        error_msg = str(exc_info.value)
-        assert "EXTENSION_MAPPING" in error_msg
-        assert "FileFormat" in error_msg
 
     def test_validate_file_extension_none_info_assertion(self):
         """Test validate_file_extension with None info raises ValueError."""